@@ -30,9 +30,12 @@ from .calculators import (
     SocialScoreCalculator,
     EconomicScoreCalculator,
     CommunityScoreCalculator,
+    ALL_CALCULATORS,
+    score_batch,
 )
+from .aggregator import score_all_categories
 from .score_calculator import ScoreCalculator
-from .models import CategoryScore, ScoreResult, PlatformData
+from .models import CategoryScore, ScoreResult, PlatformData, dumps_results
 from .decay import (
     DecayCalculator,
     DecayConfig,
@@ -50,6 +53,7 @@ __all__ = [
     "CategoryScore",
     "ScoreResult",
     "PlatformData",
+    "dumps_results",
     "CodeScoreCalculator",
     "ContentScoreCalculator",
     "IdentityScoreCalculator",
@@ -57,6 +61,9 @@ __all__ = [
     "EconomicScoreCalculator",
     "CommunityScoreCalculator",
     "MentoringScoreCalculator",
+    "ALL_CALCULATORS",
+    "score_batch",
+    "score_all_categories",
     "DecayCalculator",
     "DecayConfig",
     "DecayRate",
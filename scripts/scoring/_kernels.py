@@ -0,0 +1,150 @@
+"""
+Numeric kernels for batch scoring.
+
+score_rows turns an (N, K) matrix of dimension values into N capped
+category scores. decay_rows applies per-column score decay to an (N, C)
+score matrix, and decay_composite_rows also folds the decayed row into
+its weighted composite. Each is JIT-compiled with Numba when available,
+and falls back to the equivalent NumPy expression otherwise. Both
+produce identical results.
+
+Importing Numba is slow, so the scoring modules import this module only
+from their batch entry points. Kernels compile on their first call;
+compiled code is cached on disk only when NUMBA_CACHE_DIR is set, so
+read-only installs never write into the package directory.
+"""
+
+import os
+
+# Try to import NumPy, batch kernels are unavailable without it
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import Numba, use the NumPy kernel if not available
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Opt-in on-disk cache for compiled kernels, kept wherever NUMBA_CACHE_DIR says
+_CACHE = bool(os.environ.get("NUMBA_CACHE_DIR"))
+
+
+def _score_rows_numpy(values, minimums, ppu, caps, max_score):
+    """Score each row of values; NumPy implementation."""
+    points = np.minimum(np.maximum(values - minimums, 0.0) * ppu, caps)
+    # Cap the float totals and truncate in one pass; totals are never
+    # negative, so this matches min(int(total), max_score)
+    return np.minimum(points.sum(axis=1), max_score).astype(np.int32, copy=False)
+
+
+def _decay_rows_numpy(raw_scores, days, grace, rate, max_pct, half_life):
+    """Decay each score by its column's parameters; NumPy implementation."""
+    effective = days - grace
+    exponential = 0.5 ** (effective / np.where(half_life > 0, half_life, 1.0))
+    linear = 1.0 - np.minimum(effective * rate, max_pct) / 100.0
+    multiplier = np.maximum(
+        np.where(half_life > 0, exponential, linear), 1.0 - max_pct / 100.0
+    )
+    multiplier = np.where(days <= grace, 1.0, multiplier)
+    return (raw_scores * multiplier).astype(np.int64)
+
+
+def _decay_composite_rows_numpy(raw_scores, days, grace, rate, max_pct, half_life,
+                                weights, total_weight):
+    """Decayed scores and weighted composites; NumPy implementation."""
+    adjusted = _decay_rows_numpy(raw_scores, days, grace, rate, max_pct, half_life)
+    # Column by column, so the weighted sum adds left to right like
+    # ScoreCalculator.calculate_composite
+    total_weighted = adjusted[:, 0] * weights[0]
+    for c in range(1, adjusted.shape[1]):
+        total_weighted += adjusted[:, c] * weights[c]
+    # np.rint rounds half to even, like round()
+    return adjusted, np.rint(total_weighted / total_weight).astype(np.int64)
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: reassociating the row sum could move a total across an
+    # integer boundary and disagree with the scalar calculators.
+    # No parallel=True: Numba's threading layer is not fork-safe, and
+    # score_batch already spreads work across processes.
+    @njit(cache=_CACHE)
+    def _score_rows_numba(values, minimums, ppu, caps, max_score):
+        """Score each row of values in a single fused pass."""
+        n, k = values.shape
+        out = np.empty(n, np.int32)
+        for i in range(n):
+            total = 0.0
+            for j in range(k):
+                shifted = values[i, j] - minimums[j]
+                if shifted < 0.0:
+                    shifted = 0.0
+                points = shifted * ppu[j]
+                if points > caps[j]:
+                    points = caps[j]
+                total += points
+            out[i] = min(int(total), max_score)
+        return out
+
+    @njit(cache=_CACHE)
+    def _decay_multiplier(days, grace, rate, max_pct, half_life):
+        """Remaining score multiplier for one cell (inlined by Numba)."""
+        if days <= grace:
+            return 1.0
+        effective = days - grace
+        if half_life > 0:
+            multiplier = 0.5 ** (effective / half_life)
+        else:
+            multiplier = 1.0 - min(effective * rate, max_pct) / 100.0
+        floor = 1.0 - max_pct / 100.0
+        if multiplier < floor:
+            multiplier = floor
+        return multiplier
+
+    @njit(cache=_CACHE)
+    def _decay_rows_numba(raw_scores, days, grace, rate, max_pct, half_life):
+        """Decay each score in one pass, without the NumPy temporaries."""
+        n, c = days.shape
+        out = np.empty((n, c), np.int64)
+        for i in range(n):
+            for j in range(c):
+                multiplier = _decay_multiplier(days[i, j], grace[j], rate[j],
+                                               max_pct[j], half_life[j])
+                out[i, j] = int(raw_scores[i, j] * multiplier)
+        return out
+
+    @njit(cache=_CACHE)
+    def _decay_composite_rows_numba(raw_scores, days, grace, rate, max_pct, half_life,
+                                    weights, total_weight):
+        """Decay each row and weigh it into a composite in the same pass."""
+        n, c = days.shape
+        adjusted = np.empty((n, c), np.int64)
+        composites = np.empty(n, np.int64)
+        for i in range(n):
+            total_weighted = 0.0
+            for j in range(c):
+                multiplier = _decay_multiplier(days[i, j], grace[j], rate[j],
+                                               max_pct[j], half_life[j])
+                score = int(raw_scores[i, j] * multiplier)
+                adjusted[i, j] = score
+                total_weighted += score * weights[j]
+            composites[i] = np.int64(np.rint(total_weighted / total_weight))
+        return adjusted, composites
+
+    score_rows = _score_rows_numba
+    decay_rows = _decay_rows_numba
+    decay_composite_rows = _decay_composite_rows_numba
+elif NUMPY_AVAILABLE:
+    score_rows = _score_rows_numpy
+    decay_rows = _decay_rows_numpy
+    decay_composite_rows = _decay_composite_rows_numpy
+else:
+    score_rows = None
+    decay_rows = None
+    decay_composite_rows = None
@@ -0,0 +1,136 @@
+"""
+Multi-category batch aggregation for AgentFolio.
+
+Scores every category for N agents at once. The categories with plain
+declarative dimensions are stacked into a single (N, C, K_max) value
+tensor against (C, K_max) weight tensors, so all of them are scored in
+one sweep instead of one pass per calculator. Categories with custom
+scoring (IDENTITY, ECONOMIC) are scored per record.
+
+Usage:
+    from scoring.aggregator import score_all_categories
+    
+    scores = score_all_categories([
+        {Category.CODE: github_data, Category.SOCIAL: x_data},
+        {Category.CODE: other_github_data},
+    ])
+    # scores[n, c] is agent n's score for DEFAULT_CATEGORIES[c]
+"""
+
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Try to import NumPy, fall back to per-category batches if not available
+try:
+    import numpy as np
+    
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .constants import Category, MAX_CATEGORY_SCORE
+from .models import PlatformData
+from .calculators import BaseCalculator, _DEFAULT_CALCULATORS
+
+
+# Column order of score_all_categories' result
+DEFAULT_CATEGORIES: Tuple[Category, ...] = (
+    Category.CODE,
+    Category.CONTENT,
+    Category.IDENTITY,
+    Category.SOCIAL,
+    Category.ECONOMIC,
+    Category.COMMUNITY,
+)
+
+
+def _pack_weights(calculators: Sequence[BaseCalculator]) -> Tuple[int, Any, Any, Any]:
+    """
+    Stack the calculators' dimension arrays into (C, K_max) tensors.
+    
+    Padding cells have zero points_per_unit and cap, so they add
+    exactly 0.0 to every total.
+    """
+    width = max(len(calc.dimensions) for calc in calculators)
+    minimums = np.zeros((len(calculators), width))
+    ppu = np.zeros((len(calculators), width))
+    caps = np.zeros((len(calculators), width))
+    for c, calc in enumerate(calculators):
+        _, calc_minimums, calc_ppu, calc_caps = calc.dimension_arrays()
+        k = len(calc_ppu)
+        minimums[c, :k] = calc_minimums
+        ppu[c, :k] = calc_ppu
+        caps[c, :k] = calc_caps
+    return width, minimums, ppu, caps
+
+
+def score_all_categories(
+    datas: List[Dict[Category, PlatformData]],
+    categories: Sequence[Category] = DEFAULT_CATEGORIES
+) -> Any:
+    """
+    Score every category for many agents at once.
+    
+    A category missing from an agent's data is scored as an unavailable
+    platform, like ScoreCalculator does. Scores are the raw category
+    scores (no decay), identical to calling each calculator's calculate().
+    
+    Args:
+        datas: One map of category to platform data per agent
+        categories: Categories to score, in column order
+    
+    Returns:
+        (N, C) int32 array of scores (list of rows without NumPy)
+    """
+    calculators = [_DEFAULT_CALCULATORS[category] for category in categories]
+    columns = [
+        [data.get(category) or PlatformData(platform=category.value, status="unavailable")
+         for data in datas]
+        for category in categories
+    ]
+    
+    if not NUMPY_AVAILABLE:
+        per_category = [calc.calculate_batch(column) for calc, column in zip(calculators, columns)]
+        return [list(row) for row in zip(*per_category)]
+    
+    scores = np.zeros((len(datas), len(categories)), dtype=np.int32)
+    
+    vectorized = [c for c, calc in enumerate(calculators) if calc.is_vectorizable()]
+    for c, calc in enumerate(calculators):
+        if c not in vectorized:
+            scores[:, c] = [calc.calculate(data).score for data in columns[c]]
+    
+    if not vectorized:
+        return scores
+    
+    width, minimums, ppu, caps = _pack_weights([calculators[c] for c in vectorized])
+    padding = [0.0] * width
+    error_scores = []
+    buffer = array("d")
+    for n in range(len(datas)):
+        for c in vectorized:
+            calc = calculators[c]
+            data = columns[c][n]
+            error_result = calc.handle_error(data)
+            if error_result:
+                error_scores.append((n, c, error_result.score))
+                buffer.extend(padding)
+            else:
+                row = calc.dimension_values(data)
+                buffer.extend(row)
+                buffer.extend(padding[len(row):])
+    
+    values = np.frombuffer(buffer, dtype=np.float64).reshape(len(datas), len(vectorized), width)
+    
+    points = np.minimum(np.maximum(values - minimums, 0.0) * ppu, caps)
+    # Accumulate dimension by dimension rather than points.sum(-1): the
+    # scalar calculators add left to right, and NumPy's pairwise sum may
+    # not, which could move a total across an integer boundary
+    totals = points[..., 0].copy()
+    for k in range(1, width):
+        totals += points[..., k]
+    scores[:, vectorized] = np.minimum(totals, MAX_CATEGORY_SCORE).astype(np.int32)
+    
+    for n, c, score in error_scores:
+        scores[n, c] = score
+    return scores
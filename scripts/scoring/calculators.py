@@ -7,12 +7,58 @@ for a single category based on platform data.
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Callable, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from array import array
 import math
+import os
+import sys
 
 from .constants import Category, MAX_CATEGORY_SCORE, WeightConfig
 from .models import CategoryScore, PlatformData
 
+# Try to import NumPy, score value matrices in pure Python if not available
+try:
+    import numpy as np
+    
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Interned once so every IDENTITY score reuses the same prefix object
+_HTTPS_PREFIX = sys.intern("https://")
+
+_MISSING = object()
+
+# status -> "Platform status: ..." notes for the statuses fetchers report,
+# see BaseCalculator._check_status; other statuses are formatted per call
+_STATUS_NOTES: Dict[str, str] = {
+    status: f"Platform status: {status}"
+    for status in ("error", "unavailable", "unknown", "timeout", "not_found", "ssl_error")
+}
+
+# data_sources tuples shared by every CategoryScore a calculator returns
+_SOURCES_GITHUB = ("github",)
+_SOURCES_DEVTO = ("devto", "blog")
+_SOURCES_A2A = ("a2a",)
+_SOURCES_X = ("x", "twitter")
+_SOURCES_TOKU = ("toku", "agent_card", "blockchain")
+_SOURCES_COMMUNITY = ("clawhub", "openclaw", "discord")
+_SOURCES_MOLTBOOK = ("moltbook",)
+_SOURCES_TOOLS = ("agent_card", "content_analysis")
+
+
+def _card_get(card: Dict[str, Any], camel: str, snake: str, default: Any = None) -> Any:
+    """
+    Read an agent card field that may be spelled camelCase or snake_case.
+    
+    Same result as card.get(camel, card.get(snake, default)), but the
+    snake_case key is only probed when the camelCase one is absent.
+    """
+    value = card.get(camel, _MISSING)
+    if value is _MISSING:
+        return card.get(snake, default)
+    return value
+
 
 @dataclass
 class ScoreDimension:
@@ -39,7 +85,88 @@ class ScoreDimension:
         if self.extractor:
             return self.extractor(data)
         key = self.data_key or self.key
-        return data.get(key, 0)
+        return data.get(key, 0.0)
+
+
+def _compile_fast_calc(cls: type) -> Callable[[PlatformData], Tuple[float, Tuple[float, ...]]]:
+    """
+    Generate a score_dimensions specialized to cls.dimensions.
+    
+    Weight constants, minimums and data keys are folded into straight-line
+    source, so scoring does no per-dimension dispatch or WeightConfig
+    lookups. Extractors and custom calculators are bound by name. The
+    result is identical to BaseCalculator.score_dimensions.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = [
+        "def _fast_calc(data):",
+        # Bind the raw dict's get once instead of going through PlatformData.get
+        "    get = data.data.get",
+    ]
+    for i, dim in enumerate(cls.dimensions):
+        wc = dim.weight_config
+        if dim.extractor:
+            namespace[f"_ext{i}"] = dim.extractor
+            lines.append(f"    v = _ext{i}(data)")
+        else:
+            lines.append(f"    v = get({dim.data_key or dim.key!r}, 0.0)")
+        
+        if callable(dim.calculator):
+            namespace[f"_calc{i}"] = dim.calculator
+            namespace[f"_wc{i}"] = wc
+            lines.append(f"    p{i} = _calc{i}(v, _wc{i})")
+        elif dim.calculator == "binary":
+            lines.append(f"    p{i} = {wc.max_points!r} if v else 0.0")
+        else:
+            shifted = f"v - {dim.minimum!r}" if dim.minimum else "v"
+            lines.append(
+                f"    p{i} = 0.0 if v is None else "
+                f"min(max({shifted}, 0.0) * {wc.points_per_unit!r}, {wc.max_points!r})"
+            )
+    
+    # One sum at the end instead of an add per dimension; it keeps the
+    # loop's left-to-right order so totals match to the last bit
+    points = [f"p{i}" for i in range(len(cls.dimensions))]
+    lines.append(f"    return {' + '.join(['0.0'] + points)}, ({', '.join(points)},)")
+    
+    exec(compile("\n".join(lines), f"<declarative:{cls.__name__}>", "exec"), namespace)
+    func = namespace["_fast_calc"]
+    func.__qualname__ = f"{cls.__qualname__}.score_dimensions"
+    return func
+
+
+def _compile_value_row(cls: type) -> Callable[[PlatformData], List[float]]:
+    """
+    Generate a dimension_values specialized to cls.dimensions.
+    
+    Data keys and their 0.0 defaults become literals and the binary or
+    subscore conversion is chosen once per dimension, so building a batch
+    row is a single list display. The result is identical to
+    BaseCalculator.dimension_values.
+    """
+    namespace: Dict[str, Any] = {"_NEG_INF": -math.inf}
+    lines = [
+        "def _value_row(data):",
+        "    get = data.data.get",
+    ]
+    cells = []
+    for i, dim in enumerate(cls.dimensions):
+        if dim.extractor:
+            namespace[f"_ext{i}"] = dim.extractor
+            lines.append(f"    v{i} = _ext{i}(data)")
+        else:
+            lines.append(f"    v{i} = get({dim.data_key or dim.key!r}, 0.0)")
+        
+        if dim.calculator == "binary":
+            cells.append(f"1.0 if v{i} else 0.0")
+        else:
+            cells.append(f"_NEG_INF if v{i} is None else float(v{i})")
+    lines.append(f"    return [{', '.join(cells)}]")
+    
+    exec(compile("\n".join(lines), f"<values:{cls.__name__}>", "exec"), namespace)
+    func = namespace["_value_row"]
+    func.__qualname__ = f"{cls.__qualname__}.dimension_values"
+    return func
 
 
 class BaseCalculator(ABC):
@@ -50,19 +177,68 @@ class BaseCalculator(ABC):
     pattern for defining scoring dimensions.
     """
     
+    # Calculators are created once per ScoreCalculator and hold no
+    # per-instance state beyond optional custom weights
+    __slots__ = ("weights",)
+    
     category: Category
     weights: Dict[str, WeightConfig]
     
     # Override this in subclasses to define scoring dimensions declaratively
     dimensions: List[ScoreDimension] = []
     
+    # Breakdown key for each dimension, in dimensions order
+    _dimension_keys: Tuple[str, ...] = ()
+    
+    # Packed dimension weights for batch scoring, see dimension_arrays()
+    _weight_arrays: Optional[Tuple[Tuple[str, ...], Any, Any, Any]] = None
+    
+    # Whether the scoring primitives are the stock ones, which the
+    # generated score_dimensions and the batch kernels inline
+    _stock_primitives = True
+    
+    def __init_subclass__(cls, **kwargs):
+        """Specialize score_dimensions and batch scoring for each subclass."""
+        super().__init_subclass__(**kwargs)
+        # Checked for every subclass, since one that only overrides a
+        # primitive would otherwise inherit code that ignores it
+        cls._stock_primitives = (
+            cls.calculate_dimension is BaseCalculator.calculate_dimension
+            and cls.calculate_subscore is BaseCalculator.calculate_subscore
+            and cls.calculate_binary_score is BaseCalculator.calculate_binary_score
+            and cls.cap_score is BaseCalculator.cap_score
+        )
+        score_impl = cls.score_dimensions
+        if not cls._stock_primitives:
+            if score_impl.__code__.co_filename.startswith("<declarative:"):
+                cls.score_dimensions = BaseCalculator.score_dimensions
+        elif cls.dimensions and ("dimensions" in cls.__dict__
+                                 or score_impl is BaseCalculator.score_dimensions):
+            cls.score_dimensions = staticmethod(_compile_fast_calc(cls))
+        
+        # Breakdown keys and batch weight arrays, shared by all instances
+        # since custom weights never change the declarative dimensions
+        if "dimensions" in cls.__dict__:
+            cls._dimension_keys = tuple(dim.key for dim in cls.dimensions)
+        # Repack when the dimensions changed or the primitive check
+        # disagrees with the parent's, leaving a parent's arrays shared otherwise
+        if "dimensions" in cls.__dict__ or (cls._weight_arrays is not None) != cls.is_vectorizable():
+            cls._weight_arrays = cls._pack_dimensions() if cls.is_vectorizable() else None
+            # Regenerate over a parent's generated row builder too, since
+            # that one was built for the parent's dimensions
+            values_impl = cls.dimension_values
+            if (cls._weight_arrays is not None
+                    and (values_impl is BaseCalculator.dimension_values
+                         or values_impl.__code__.co_filename.startswith("<values:"))):
+                cls.dimension_values = staticmethod(_compile_value_row(cls))
+    
     def __init__(self, weights: Optional[Dict[str, WeightConfig]] = None):
         """Initialize with optional custom weights."""
         if weights:
             self.weights = weights
     
+    @staticmethod
     def calculate_subscore(
-        self,
         weight_config: WeightConfig,
         value: Optional[float],
         minimum: float = 0
@@ -81,12 +257,11 @@ class BaseCalculator(ABC):
         if value is None:
             return 0.0
         
-        if value < minimum:
-            return 0.0
-        
-        effective_value = value - minimum
-        points = effective_value * weight_config.points_per_unit
-        return min(points, weight_config.max_points)
+        # Fused clamp: values below minimum give max(..., 0.0) == 0 points
+        return min(
+            max(value - minimum, 0.0) * weight_config.points_per_unit,
+            weight_config.max_points
+        )
     
     def calculate_binary_score(
         self,
@@ -105,8 +280,16 @@ class BaseCalculator(ABC):
         """
         return weight_config.max_points if condition else 0.0
     
-    def cap_score(self, score: float) -> int:
-        """Cap score at maximum and return as int."""
+    @staticmethod
+    def cap_score(score: float) -> int:
+        """
+        Cap score at maximum and return as int.
+        
+        Kept as a plain min(): in the interpreter it beats any bitwise
+        branchless clamp, and a JIT-compiled copy of the same expression
+        lowers to a conditional move anyway. Static so batch kernels can
+        call it without a calculator instance.
+        """
         return min(int(score), MAX_CATEGORY_SCORE)
     
     def handle_error(self, data: PlatformData) -> Optional[CategoryScore]:
@@ -116,13 +299,25 @@ class BaseCalculator(ABC):
         Returns:
             CategoryScore if handling as error, None if should proceed
         """
-        if data.status != "ok":
-            return CategoryScore(
-                category=self.category,
-                score=0,
-                notes=f"Platform status: {data.status}"
-            )
-        return None
+        return self._check_status(data)
+    
+    def _check_status(self, data: PlatformData) -> Optional[CategoryScore]:
+        """
+        Zero score for any non-ok platform status, None if ok.
+        
+        Notes for the known statuses are formatted once, at import; an
+        unexpected status is formatted on the fly rather than remembered,
+        so arbitrary status strings can't grow the table. The score itself
+        is built fresh on every call since callers adjust score and notes
+        in place (decay, community fallback notes).
+        """
+        status = data.status
+        if status == "ok":
+            return None
+        notes = _STATUS_NOTES.get(status)
+        if notes is None:
+            notes = f"Platform status: {status}"
+        return CategoryScore._make(category=self.category, score=0, notes=notes)
     
     def calculate_dimension(
         self,
@@ -154,6 +349,24 @@ class BaseCalculator(ABC):
             dimension.minimum
         ), value
     
+    def score_dimensions(self, data: PlatformData) -> Tuple[float, Tuple[float, ...]]:
+        """
+        Score every declarative dimension.
+        
+        Subclasses get a generated, constant-folded version of this at
+        class creation (see _compile_fast_calc); this loop is the reference.
+        
+        Returns:
+            Tuple of (total, points per dimension in dimensions order)
+        """
+        total = 0.0
+        points = []
+        for dim in self.dimensions:
+            dim_points, _ = self.calculate_dimension(dim, data)
+            points.append(dim_points)
+            total += dim_points
+        return total, tuple(points)
+    
     def calculate_declarative(self, data: PlatformData) -> CategoryScore:
         """
         Calculate score using declarative dimensions list.
@@ -164,15 +377,10 @@ class BaseCalculator(ABC):
         if error_result:
             return error_result
         
-        breakdown = {}
-        total = 0.0
+        total, points = self.score_dimensions(data)
+        breakdown = dict(zip(self._dimension_keys, points))
         
-        for dim in self.dimensions:
-            points, raw_value = self.calculate_dimension(dim, data)
-            breakdown[dim.key] = points
-            total += points
-        
-        return CategoryScore(
+        return CategoryScore._make(
             category=self.category,
             score=self.cap_score(total),
             raw_score=total,
@@ -182,9 +390,162 @@ class BaseCalculator(ABC):
             notes=self.generate_notes(breakdown, data)
         )
     
-    def get_data_sources(self) -> List[str]:
-        """Return list of data sources used. Override in subclasses."""
-        return []
+    @classmethod
+    def is_vectorizable(cls) -> bool:
+        """
+        Whether every dimension is a plain subscore or binary dimension
+        scored by the stock primitives.
+        """
+        return bool(cls.dimensions) and cls._stock_primitives and all(
+            dim.calculator in ("subscore", "binary") for dim in cls.dimensions
+        )
+    
+    @classmethod
+    def _pack_dimensions(cls) -> Tuple[Tuple[str, ...], Any, Any, Any]:
+        """Build the dimension_arrays() tuple for this class's dimensions."""
+        keys = tuple(dim.key for dim in cls.dimensions)
+        minimums = [0.0 if dim.calculator == "binary" else float(dim.minimum)
+                    for dim in cls.dimensions]
+        ppu = [float(dim.weight_config.max_points if dim.calculator == "binary"
+                     else dim.weight_config.points_per_unit)
+               for dim in cls.dimensions]
+        caps = [float(dim.weight_config.max_points) for dim in cls.dimensions]
+        
+        if not NUMPY_AVAILABLE:
+            return keys, tuple(minimums), tuple(ppu), tuple(caps)
+        
+        arrays = []
+        for values in (minimums, ppu, caps):
+            packed = np.array(values, dtype=np.float64)
+            packed.flags.writeable = False  # Shared by every instance
+            arrays.append(packed)
+        return (keys, *arrays)
+    
+    def dimension_arrays(self) -> Tuple[Tuple[str, ...], Any, Any, Any]:
+        """
+        Pack the declarative dimensions into parallel weight arrays.
+        
+        Binary dimensions are encoded as minimum 0 with points_per_unit
+        equal to max_points, so a 0/1 value scores nothing or full points.
+        The arrays are built once per class and are read-only.
+        
+        Returns:
+            Tuple of (keys, minimums, points_per_unit, caps); the last
+            three are float64 arrays when NumPy is available, else tuples
+        """
+        if self._weight_arrays is None:
+            raise TypeError(f"{type(self).__name__} has no vectorizable dimensions")
+        return self._weight_arrays
+    
+    def dimension_values(self, data: PlatformData) -> List[float]:
+        """
+        Extract one row of dimension values for score_matrix.
+        
+        Binary values become 0.0/1.0. None becomes -inf, which clamps
+        to zero points like the scalar path. Vectorizable subclasses get a
+        generated version of this at class creation (see _compile_value_row).
+        """
+        get = data.data.get
+        row = []
+        for dim in self.dimensions:
+            if dim.extractor:
+                value = dim.extractor(data)
+            else:
+                value = get(dim.data_key or dim.key, 0.0)
+            if dim.calculator == "binary":
+                row.append(1.0 if value else 0.0)
+            else:
+                row.append(-math.inf if value is None else float(value))
+        return row
+    
+    def score_matrix(self, values: Any) -> Any:
+        """
+        Score many rows of dimension values in one vectorized pass.
+        
+        Computes min(max(v - minimum, 0) * points_per_unit, max_points)
+        per cell and sums each row, so scoring N agents is a handful of
+        array operations instead of N * K subscore calls.
+        
+        Args:
+            values: (N, K) matrix of values in dimensions order,
+                as produced row by row by dimension_values()
+            
+        Returns:
+            Raw (uncapped) totals per row, as an array or list
+        """
+        _, minimums, ppu, caps = self.dimension_arrays()
+        
+        if NUMPY_AVAILABLE:
+            values = np.asarray(values, dtype=np.float64).reshape(-1, len(ppu))
+            points = np.minimum(np.maximum(values - minimums, 0.0) * ppu, caps)
+            return points.sum(axis=1)
+        
+        return [
+            sum(min(max(v - m, 0.0) * u, c) for v, m, u, c in zip(row, minimums, ppu, caps))
+            for row in values
+        ]
+    
+    def calculate_batch(self, datas: List[PlatformData]) -> Any:
+        """
+        Score many records of this category at once.
+        
+        Builds one (N, K) value matrix and scores it with the batch kernel
+        (Numba-compiled when available, see _kernels).
+        Only final scores are produced; no CategoryScore objects are
+        built, so call calculate() for records whose breakdown is needed.
+        Records rejected by handle_error keep their error score.
+        Calculators with custom scoring fall back to calculate() per record.
+        
+        Args:
+            datas: Platform records to score
+            
+        Returns:
+            int32 array of capped scores in input order (list without NumPy)
+        """
+        if not self.is_vectorizable():
+            scores = [self.calculate(data).score for data in datas]
+            return np.array(scores, dtype=np.int32) if NUMPY_AVAILABLE else scores
+        
+        if not NUMPY_AVAILABLE:
+            # Without NumPy the generated score_dimensions is the fastest
+            # per-record path; no value matrix is needed
+            scores = []
+            for data in datas:
+                error_result = self.handle_error(data)
+                if error_result:
+                    scores.append(error_result.score)
+                else:
+                    scores.append(self.cap_score(self.score_dimensions(data)[0]))
+            return scores
+        
+        width = len(self.dimensions)
+        empty_row = [0.0] * width
+        error_scores = {}
+        # Rows go straight into one packed float64 buffer that NumPy then
+        # wraps without copying, instead of keeping N row lists alive
+        buffer = array("d")
+        for i, data in enumerate(datas):
+            error_result = self.handle_error(data)
+            if error_result:
+                error_scores[i] = error_result.score
+                buffer.extend(empty_row)
+            else:
+                buffer.extend(self.dimension_values(data))
+        
+        # Imported here: loading Numba would slow every `import scoring`
+        from ._kernels import score_rows
+        
+        values = np.frombuffer(buffer, dtype=np.float64).reshape(len(datas), width)
+        _, minimums, ppu, caps = self.dimension_arrays()
+        scores = score_rows(values, minimums, ppu, caps, MAX_CATEGORY_SCORE)
+        
+        for i, score in error_scores.items():
+            scores[i] = score
+        return scores
+    
+    def get_data_sources(self) -> Tuple[str, ...]:
+        """Return the data sources used. Override in subclasses."""
+        return ()
     
     def generate_notes(
         self,
@@ -212,6 +573,7 @@ class CodeScoreCalculator(BaseCalculator):
     """Calculator for CODE category (GitHub)."""
     
     category = Category.CODE
+    __slots__ = ()
     
     dimensions = [
         ScoreDimension(
@@ -257,8 +619,8 @@ class CodeScoreCalculator(BaseCalculator):
         ),
     ]
     
-    def get_data_sources(self) -> List[str]:
-        return ["github"]
+    def get_data_sources(self) -> Tuple[str, ...]:
+        return _SOURCES_GITHUB
     
     def generate_notes(self, breakdown: Dict[str, float], data: PlatformData) -> Optional[str]:
         """Generate notes with key metrics."""
@@ -273,10 +635,18 @@ class CodeScoreCalculator(BaseCalculator):
         return self.calculate_declarative(data)
 
 
+def _engagement_rate(data: PlatformData) -> float:
+    """Average reactions per article, 0.0 without articles (one lookup per key)."""
+    get = data.data.get
+    articles = get("article_count", 0)
+    return get("total_reactions", 0.0) / articles if articles > 0 else 0.0
+
+
 class ContentScoreCalculator(BaseCalculator):
     """Calculator for CONTENT category (dev.to, blog)."""
     
     category = Category.CONTENT
+    __slots__ = ()
     
     dimensions = [
         ScoreDimension(
@@ -302,7 +672,7 @@ class ContentScoreCalculator(BaseCalculator):
                 unit_name="follower estimate", description="Followers"
             ),
             # Custom extractor: estimate followers from articles
-            extractor=lambda d: d.get("followers", d.get("article_count", 0) * 5)
+            extractor=lambda d: d.get("followers", d.get("article_count", 0.0) * 5)
         ),
         ScoreDimension(
             key="engagement_rate",
@@ -310,15 +680,12 @@ class ContentScoreCalculator(BaseCalculator):
                 max_points=10, points_per_unit=1.0,
                 unit_name="engagement", description="Avg engagement"
             ),
-            extractor=lambda d: (
-                d.get("total_reactions", 0) / d.get("article_count", 1)
-                if d.get("article_count", 0) > 0 else 0
-            )
+            extractor=_engagement_rate
         ),
     ]
     
-    def get_data_sources(self) -> List[str]:
-        return ["devto", "blog"]
+    def get_data_sources(self) -> Tuple[str, ...]:
+        return _SOURCES_DEVTO
     
     def generate_notes(self, breakdown: Dict[str, float], data: PlatformData) -> Optional[str]:
         """Generate notes with content metrics."""
@@ -338,6 +705,7 @@ class SocialScoreCalculator(BaseCalculator):
     """Calculator for SOCIAL category (X/Twitter)."""
     
     category = Category.SOCIAL
+    __slots__ = ()
     
     dimensions = [
         ScoreDimension(
@@ -383,13 +751,13 @@ class SocialScoreCalculator(BaseCalculator):
         ),
     ]
     
-    def get_data_sources(self) -> List[str]:
-        return ["x", "twitter"]
+    def get_data_sources(self) -> Tuple[str, ...]:
+        return _SOURCES_X
     
     def handle_error(self, data: PlatformData) -> Optional[CategoryScore]:
         """Handle X-specific error states."""
         if data.status == "unavailable":
-            return CategoryScore(
+            return CategoryScore._make(
                 category=self.category,
                 score=0,
                 notes="Platform unavailable"
@@ -417,11 +785,12 @@ class EconomicScoreCalculator(BaseCalculator):
     """
     
     category = Category.ECONOMIC
+    __slots__ = ()
     
     def __init__(self, weights: Optional[Dict[str, WeightConfig]] = None):
         """Initialize with default ECONOMIC weights."""
-        # No dimensions - we're using custom calculate method
-        self.dimensions = []
+        # No dimensions - we're using custom calculate method, so the
+        # empty class-level default from BaseCalculator is used as-is
     
     def _calculate_base_score(self, data: PlatformData) -> Tuple[float, Dict[str, Any]]:
         """
@@ -443,13 +812,13 @@ class EconomicScoreCalculator(BaseCalculator):
             score += 5.0
             breakdown["has_profile"] = True
         
-        services_count = data.get("services_count", 0)
+        services_count = data.get("services_count", 0.0)
         if services_count > 0:
             score += 3.0
             breakdown["has_services"] = True
         
         prices = data.get("prices", [])
-        avg_price = data.get("avg_service_price", 0)
+        avg_price = data.get("avg_service_price", 0.0)
         if prices or avg_price > 0:
             score += 2.0
             breakdown["has_prices"] = True
@@ -553,7 +922,7 @@ class EconomicScoreCalculator(BaseCalculator):
             models.add("x402_micropayments")
         
         # Check for high-value contracts (evidence of direct deals)
-        max_price = data.get("max_service_price", 0)
+        max_price = data.get("max_service_price", 0.0)
         if max_price >= 500:
             models.add("enterprise_contracts")
         
@@ -598,7 +967,7 @@ class EconomicScoreCalculator(BaseCalculator):
             breakdown["on_chain_proof"] = True
         
         # Customer verification (reviews, testimonials)
-        reputation = data.get("reputation_score", 0)
+        reputation = data.get("reputation_score", 0.0)
         if reputation >= 50:
             score += 5.0
             breakdown["customer_verified"] = True
@@ -661,7 +1030,7 @@ class EconomicScoreCalculator(BaseCalculator):
             score = 1.0
         
         # Bonus for very recent job completion
-        jobs = data.get("jobs_completed", 0)
+        jobs = data.get("jobs_completed", 0.0)
         if jobs > 0 and score >= 5.0:
             score += 1.0
             breakdown["recent_jobs_bonus"] = True
@@ -669,13 +1038,13 @@ class EconomicScoreCalculator(BaseCalculator):
         breakdown["recency_score"] = min(score, 10.0)
         return min(score, 10.0), breakdown
     
-    def get_data_sources(self) -> List[str]:
-        return ["toku", "agent_card", "blockchain"]
+    def get_data_sources(self) -> Tuple[str, ...]:
+        return _SOURCES_TOKU
     
     def handle_error(self, data: PlatformData) -> Optional[CategoryScore]:
         """Handle toku-specific partial credit."""
         if data.status == "unavailable":
-            return CategoryScore(
+            return CategoryScore._make(
                 category=self.category,
                 score=5,
                 breakdown={
@@ -769,7 +1138,7 @@ class EconomicScoreCalculator(BaseCalculator):
         
         notes = self.generate_notes(total, factor_breakdowns, data)
         
-        return CategoryScore(
+        return CategoryScore._make(
             category=self.category,
             score=total,
             raw_score=total,
@@ -784,6 +1153,7 @@ class CommunityScoreCalculator(BaseCalculator):
     """Calculator for COMMUNITY category (ClawHub/OpenClaw)."""
     
     category = Category.COMMUNITY
+    __slots__ = ()
     
     dimensions = [
         ScoreDimension(
@@ -821,8 +1191,8 @@ class CommunityScoreCalculator(BaseCalculator):
         ),
     ]
     
-    def get_data_sources(self) -> List[str]:
-        return ["clawhub", "openclaw", "discord"]
+    def get_data_sources(self) -> Tuple[str, ...]:
+        return _SOURCES_COMMUNITY
     
     def calculate(self, data: PlatformData) -> CategoryScore:
         """Calculate COMMUNITY score from ClawHub/OpenClaw data."""
@@ -839,6 +1209,7 @@ class MentoringScoreCalculator(BaseCalculator):
     """Calculator for MENTORING category (Moltbook karma/engagement)."""
     
     category = Category.MENTORING
+    __slots__ = ()
     
     dimensions = [
         ScoreDimension(
@@ -856,8 +1227,8 @@ class MentoringScoreCalculator(BaseCalculator):
                 unit_name="ratio", description="Comments to posts ratio"
             ),
             extractor=lambda d: (
-                d.get("comments_count", 0) / d.get("posts_count", 1)
-                if d.get("posts_count", 0) > 0 else 0
+                d.get("comments_count", 0.0) / d.get("posts_count", 1)
+                if d.get("posts_count", 0) > 0 else 0.0
             )
         ),
         ScoreDimension(
@@ -888,8 +1259,8 @@ class MentoringScoreCalculator(BaseCalculator):
         ),
     ]
     
-    def get_data_sources(self) -> List[str]:
-        return ["moltbook"]
+    def get_data_sources(self) -> Tuple[str, ...]:
+        return _SOURCES_MOLTBOOK
     
     def generate_notes(self, breakdown: Dict[str, float], data: PlatformData) -> Optional[str]:
         """Generate notes with mentoring metrics."""
@@ -911,6 +1282,16 @@ class MentoringScoreCalculator(BaseCalculator):
         return self.calculate_declarative(data)
 
 
+# Points for IDENTITY's yes/no checks in flag-mask bit order: schema 1.0,
+# humanReadableId, HTTPS endpoint, interfaces, auth schemes, agents.json,
+# llms.txt. The totals table holds the summed points for all 128 masks.
+_IDENTITY_FLAG_POINTS = (10.0, 10.0, 5.0, 5.0, 5.0, 3.0, 2.0)
+_IDENTITY_FLAG_TOTALS = tuple(
+    sum((p for bit, p in enumerate(_IDENTITY_FLAG_POINTS) if mask >> bit & 1), 0.0)
+    for mask in range(1 << len(_IDENTITY_FLAG_POINTS))
+)
+
+
 class IdentityScoreCalculator(BaseCalculator):
     """
     Calculator for IDENTITY category using A2A v1.0 protocol data.
@@ -921,6 +1302,7 @@ class IdentityScoreCalculator(BaseCalculator):
     """
     
     category = Category.IDENTITY
+    __slots__ = ()
     
     # Required A2A v1.0 fields
     A2A_REQUIRED_FIELDS = [
@@ -929,6 +1311,26 @@ class IdentityScoreCalculator(BaseCalculator):
         "version"
     ]
     
+    # (camelCase, snake_case) spelling of each required field, derived once
+    _REQUIRED_FIELD_PAIRS = tuple(
+        (field, field.replace("Version", "_version").replace("Id", "_id"))
+        for field in A2A_REQUIRED_FIELDS
+    )
+    
+    # (camelCase, snake_case, points) for each optional metadata field
+    _OPTIONAL_METADATA_FIELDS = tuple(
+        (field,
+         field.replace("iconUrl", "icon_url").replace("PolicyUrl", "_policy_url").replace("ServiceUrl", "_service_url"),
+         points)
+        for field, points in (
+            ("tags", 1.0),
+            ("iconUrl", 1.0),
+            ("privacyPolicyUrl", 1.0),
+            ("termsOfServiceUrl", 1.0),
+            ("lastUpdated", 1.0),
+        )
+    )
+    
     def _extract_card(self, data: PlatformData) -> Optional[Dict[str, Any]]:
         """Extract and return the agent card from platform data."""
         card = data.get("card", {})
@@ -938,7 +1340,7 @@ class IdentityScoreCalculator(BaseCalculator):
     
     def _check_schema_version(self, card: Dict[str, Any]) -> bool:
         """Check if card has A2A schemaVersion 1.0."""
-        version = card.get("schemaVersion", card.get("schema_version", ""))
+        version = _card_get(card, "schemaVersion", "schema_version", "")
         return version == "1.0"
     
     def _check_required_fields(self, card: Dict[str, Any]) -> float:
@@ -950,19 +1352,18 @@ class IdentityScoreCalculator(BaseCalculator):
             return 0.0
         
         present = 0
-        for field in self.A2A_REQUIRED_FIELDS:
+        for field, snake_field in self._REQUIRED_FIELD_PAIRS:
             # Handle both camelCase and snake_case
-            snake_field = field.replace("Version", "_version").replace("Id", "_id")
             if field in card and card[field] is not None:
                 present += 1
             elif snake_field in card and card[snake_field] is not None:
                 present += 1
         
-        return (present / len(self.A2A_REQUIRED_FIELDS)) * 15
+        return (present / len(self._REQUIRED_FIELD_PAIRS)) * 15
     
     def _check_human_readable_id(self, card: Dict[str, Any]) -> tuple[bool, str]:
         """Check if humanReadableId follows proper format (org/agent-name)."""
-        hr_id = card.get("humanReadableId", card.get("human_readable_id", ""))
+        hr_id = _card_get(card, "humanReadableId", "human_readable_id", "")
         if not hr_id:
             return False, ""
         
@@ -996,7 +1397,6 @@ class IdentityScoreCalculator(BaseCalculator):
             return 0.0, 0.0
         
         base_score = 0.0
-        advanced_score = 0.0
         
         # Must have a2aVersion
         if caps.get("a2aVersion") == "1.0" or caps.get("a2a_version") == "1.0":
@@ -1004,17 +1404,14 @@ class IdentityScoreCalculator(BaseCalculator):
         elif caps.get("a2aVersion") or caps.get("a2a_version"):
             base_score = 5.0
         
-        features = 0
-        if caps.get("supportsTools") or caps.get("supports_tools"):
-            features += 1
-        if caps.get("supportsStreaming") or caps.get("supports_streaming"):
-            features += 1
-        if caps.get("supportsPushNotifications") or caps.get("supports_push_notifications"):
-            features += 1
-        if caps.get("supportedMessageParts") or caps.get("supported_message_parts"):
-            features += 1
-        if caps.get("mcpVersion") or caps.get("mcp_version"):
-            features += 1
+        # Sum of booleans instead of five separate increment branches
+        features = (
+            bool(caps.get("supportsTools") or caps.get("supports_tools"))
+            + bool(caps.get("supportsStreaming") or caps.get("supports_streaming"))
+            + bool(caps.get("supportsPushNotifications") or caps.get("supports_push_notifications"))
+            + bool(caps.get("supportedMessageParts") or caps.get("supported_message_parts"))
+            + bool(caps.get("mcpVersion") or caps.get("mcp_version"))
+        )
         
         advanced_score = min(features * 2, 10)
         
@@ -1035,7 +1432,7 @@ class IdentityScoreCalculator(BaseCalculator):
     
     def _check_interfaces(self, card: Dict[str, Any]) -> tuple[int, list]:
         """Check supported interfaces. Returns (count, interfaces_list)."""
-        interfaces = card.get("supportedInterfaces", card.get("supported_interfaces", []))
+        interfaces = _card_get(card, "supportedInterfaces", "supported_interfaces", [])
         if not isinstance(interfaces, list):
             interfaces = []
         
@@ -1048,7 +1445,7 @@ class IdentityScoreCalculator(BaseCalculator):
     
     def _check_auth_schemes(self, card: Dict[str, Any]) -> tuple[int, list]:
         """Check authentication schemes. Returns (count, schemes_list)."""
-        schemes = card.get("authSchemes", card.get("auth_schemes", []))
+        schemes = _card_get(card, "authSchemes", "auth_schemes", [])
         if not isinstance(schemes, list):
             schemes = []
         
@@ -1065,16 +1462,7 @@ class IdentityScoreCalculator(BaseCalculator):
             return 0.0
         
         score = 0.0
-        checks = [
-            ("tags", 1.0),
-            ("iconUrl", 1.0),
-            ("privacyPolicyUrl", 1.0),
-            ("termsOfServiceUrl", 1.0),
-            ("lastUpdated", 1.0),
-        ]
-        
-        for field, points in checks:
-            snake_field = field.replace("iconUrl", "icon_url").replace("PolicyUrl", "_policy_url").replace("ServiceUrl", "_service_url")
+        for field, snake_field, points in self._OPTIONAL_METADATA_FIELDS:
             if card.get(field) or card.get(snake_field):
                 score += points
         
@@ -1082,14 +1470,12 @@ class IdentityScoreCalculator(BaseCalculator):
     
     def calculate(self, data: PlatformData) -> CategoryScore:
         """Calculate IDENTITY score from A2A v1.0 data."""
-        breakdown = {}
-        total = 0.0
-        
         status = data.get("status", "unknown")
         card = self._extract_card(data)
         
+        # Failed fetches without a card skip all checks
         if not card and status not in ["ok", "ssl_error"]:
-            return CategoryScore(
+            return CategoryScore._make(
                 category=self.category,
                 score=0,
                 notes=f"Platform status: {status} (no agent card)"
@@ -1097,79 +1483,79 @@ class IdentityScoreCalculator(BaseCalculator):
         
         # A2A v1.0 Schema Compliance
         has_v1_schema = self._check_schema_version(card) if card else False
-        breakdown["schema_version"] = 10.0 if has_v1_schema else 0.0
-        total += breakdown["schema_version"]
-        
         required_score = self._check_required_fields(card) if card else 0.0
-        breakdown["required_fields"] = required_score
-        total += required_score
-        
         hr_valid, _ = self._check_human_readable_id(card) if card else (False, "")
-        breakdown["human_readable_id"] = 10.0 if hr_valid else 0.0
-        total += breakdown["human_readable_id"]
         
         # Provider Information
         provider_score, _ = self._check_provider(card) if card else (0.0, {})
-        breakdown["provider_info"] = provider_score
-        total += provider_score
         
         # Endpoint HTTPS
         url = card.get("url", "") if card else ""
-        has_https = url.startswith("https://")
-        breakdown["endpoint_https"] = 5.0 if has_https else 0.0
-        total += breakdown["endpoint_https"]
+        has_https = url.startswith(_HTTPS_PREFIX)
         
-        # Capabilities
+        # Capabilities, skills, interfaces, authentication
         base_caps, adv_caps = self._check_capabilities(card) if card else (0.0, 0.0)
-        breakdown["capabilities_declared"] = base_caps
-        breakdown["advanced_capabilities"] = adv_caps
-        total += base_caps + adv_caps
-        
-        # Skills
         skill_count, _ = self._check_skills(card) if card else (0, [])
-        breakdown["skills_defined"] = min(skill_count * 2, 10)
-        total += breakdown["skills_defined"]
-        
-        # Interfaces
+        skills_score = min(skill_count * 2, 10)
         interface_count, _ = self._check_interfaces(card) if card else (0, [])
-        breakdown["interfaces_declared"] = 5.0 if interface_count > 0 else 0.0
-        total += breakdown["interfaces_declared"]
-        
-        # Authentication
         auth_count, _ = self._check_auth_schemes(card) if card else (0, [])
-        breakdown["auth_schemes"] = 5.0 if auth_count > 0 else 0.0
-        total += breakdown["auth_schemes"]
         
         # Optional Metadata
         metadata_score = self._check_optional_metadata(card) if card else 0.0
-        breakdown["optional_metadata"] = metadata_score
-        total += metadata_score
         
         # Additional Standards
-        has_agents_json = data.get("has_agents_json", False)
-        breakdown["has_agents_json"] = 3.0 if has_agents_json else 0.0
-        total += breakdown["has_agents_json"]
+        has_agents_json = bool(data.get("has_agents_json", False))
+        has_llms_txt = bool(data.get("has_llms_txt", False))
+        
+        # The seven yes/no checks as a bitmask, bit i worth _IDENTITY_FLAG_POINTS[i]
+        flags = (
+            has_v1_schema
+            | hr_valid << 1
+            | has_https << 2
+            | (interface_count > 0) << 3
+            | (auth_count > 0) << 4
+            | has_agents_json << 5
+            | has_llms_txt << 6
+        )
         
-        has_llms_txt = data.get("has_llms_txt", False)
-        breakdown["has_llms_txt"] = 2.0 if has_llms_txt else 0.0
-        total += breakdown["has_llms_txt"]
+        breakdown = {
+            "schema_version": 10.0 if has_v1_schema else 0.0,
+            "required_fields": required_score,
+            "human_readable_id": 10.0 if hr_valid else 0.0,
+            "provider_info": provider_score,
+            "endpoint_https": 5.0 if has_https else 0.0,
+            "capabilities_declared": base_caps,
+            "advanced_capabilities": adv_caps,
+            "skills_defined": skills_score,
+            "interfaces_declared": 5.0 if interface_count > 0 else 0.0,
+            "auth_schemes": 5.0 if auth_count > 0 else 0.0,
+            "optional_metadata": metadata_score,
+            "has_agents_json": 3.0 if has_agents_json else 0.0,
+            "has_llms_txt": 2.0 if has_llms_txt else 0.0,
+        }
+        total = (
+            _IDENTITY_FLAG_TOTALS[flags] + required_score + provider_score
+            + (base_caps + adv_caps) + skills_score + metadata_score
+        )
         
-        # Build notes
-        notes_parts = [f"Status: {status}"]
+        # Build notes as a single f-string; the part count is fixed, so no list + join
         if card:
-            notes_parts.append(f"A2A schema: {'1.0' if has_v1_schema else 'other/missing'}")
-            notes_parts.append(f"Skills: {skill_count}")
-            notes_parts.append(f"Auth schemes: {auth_count}")
-            notes_parts.append(f"Interfaces: {interface_count}")
+            notes = (
+                f"Status: {status} | A2A schema: {'1.0' if has_v1_schema else 'other/missing'}"
+                f" | Skills: {skill_count} | Auth schemes: {auth_count}"
+                f" | Interfaces: {interface_count}"
+            )
+        else:
+            notes = f"Status: {status}"
         
-        return CategoryScore(
+        return CategoryScore._make(
             category=self.category,
             score=self.cap_score(total),
             raw_score=total,
             max_score=MAX_CATEGORY_SCORE,
             breakdown=breakdown,
-            data_sources=["a2a"],
-            notes=" | ".join(notes_parts)
+            data_sources=_SOURCES_A2A,
+            notes=notes
         )
 
 
@@ -1177,6 +1563,7 @@ class ToolsScoreCalculator(BaseCalculator):
     """Calculator for TOOLS category (tool/skill usage and diversity)."""
     
     category = Category.TOOLS
+    __slots__ = ()
     
     dimensions = [
         ScoreDimension(
@@ -1222,9 +1609,9 @@ class ToolsScoreCalculator(BaseCalculator):
         ),
     ]
     
-    def get_data_sources(self):
+    def get_data_sources(self) -> Tuple[str, ...]:
         """Return data sources for tools."""
-        return ["agent_card", "content_analysis"]
+        return _SOURCES_TOOLS
     
     def generate_notes(self, breakdown, data):
         """Generate notes about tool usage."""
@@ -1246,3 +1633,107 @@ class ToolsScoreCalculator(BaseCalculator):
         """Calculate TOOLS score from platform data."""
         return self.calculate_declarative(data)
 
+
+# Registry of calculators by class name, so batch workers can rebuild
+# a calculator from a picklable name instead of a calculator instance
+CALCULATORS: Dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        CodeScoreCalculator,
+        ContentScoreCalculator,
+        SocialScoreCalculator,
+        EconomicScoreCalculator,
+        CommunityScoreCalculator,
+        MentoringScoreCalculator,
+        IdentityScoreCalculator,
+        ToolsScoreCalculator,
+    )
+}
+
+_CALCULATOR_BY_CATEGORY: Dict[Category, str] = {
+    cls.category: name for name, cls in CALCULATORS.items()
+}
+
+# Shared default-weight instances. Calculators keep no per-call state, so
+# callers without custom weights reuse these instead of constructing one
+CODE_CALCULATOR = CodeScoreCalculator()
+CONTENT_CALCULATOR = ContentScoreCalculator()
+IDENTITY_CALCULATOR = IdentityScoreCalculator()
+SOCIAL_CALCULATOR = SocialScoreCalculator()
+ECONOMIC_CALCULATOR = EconomicScoreCalculator()
+COMMUNITY_CALCULATOR = CommunityScoreCalculator()
+MENTORING_CALCULATOR = MentoringScoreCalculator()
+TOOLS_CALCULATOR = ToolsScoreCalculator()
+
+# In Category order
+ALL_CALCULATORS: Tuple[BaseCalculator, ...] = (
+    CODE_CALCULATOR,
+    CONTENT_CALCULATOR,
+    IDENTITY_CALCULATOR,
+    SOCIAL_CALCULATOR,
+    ECONOMIC_CALCULATOR,
+    COMMUNITY_CALCULATOR,
+    MENTORING_CALCULATOR,
+    TOOLS_CALCULATOR,
+)
+
+_DEFAULT_CALCULATORS: Dict[Category, BaseCalculator] = {
+    calc.category: calc for calc in ALL_CALCULATORS
+}
+
+
+def _score_one(args: Tuple[str, Optional[Dict[str, WeightConfig]], Dict[str, Any]]) -> CategoryScore:
+    """Score a single platform record inside a worker process."""
+    calc_class_name, weights, data_dict = args
+    calc_class = CALCULATORS[calc_class_name]
+    calc = calc_class(weights) if weights else _DEFAULT_CALCULATORS[calc_class.category]
+    return calc.calculate(PlatformData(**data_dict))
+
+
+def score_batch(
+    datas_per_category: Dict[Category, List[PlatformData]],
+    weights: Optional[Dict[Category, Dict[str, WeightConfig]]] = None,
+    max_workers: Optional[int] = None
+) -> Dict[Category, List[CategoryScore]]:
+    """
+    Score many agents across all categories in parallel.
+    
+    Every (category, record) pair is independent, so the work is spread
+    over a process pool. Records are chunked to amortize IPC, since a
+    single calculation is cheap compared to a round trip to a worker.
+    
+    Args:
+        datas_per_category: Map of category to the platform records to score
+        weights: Optional custom weights per category
+        max_workers: Worker processes to use (default: CPU count);
+            1 scores inline without starting a pool
+        
+    Returns:
+        Map of category to CategoryScores, in the same order as the input
+    """
+    weights = weights or {}
+    args = []
+    for category, records in datas_per_category.items():
+        calc_class_name = _CALCULATOR_BY_CATEGORY[category]
+        for data in records:
+            args.append((calc_class_name, weights.get(category), asdict(data)))
+    
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(args) <= 1:
+        scores = [_score_one(a) for a in args]
+    else:
+        # Imported here: multiprocessing is the heaviest import in this module
+        # and only batch scoring needs it
+        from concurrent.futures import ProcessPoolExecutor
+        
+        chunksize = max(1, len(args) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            scores = list(ex.map(_score_one, args, chunksize=chunksize))
+    
+    results: Dict[Category, List[CategoryScore]] = {}
+    offset = 0
+    for category, records in datas_per_category.items():
+        results[category] = scores[offset:offset + len(records)]
+        offset += len(records)
+    
+    return results
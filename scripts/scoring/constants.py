@@ -4,9 +4,17 @@ Scoring constants and configuration.
 All magic numbers from the original score.py centralized here with documentation.
 """
 
+from bisect import bisect_right
 from enum import Enum
-from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List, NamedTuple, Sequence
+
+# Try to import NumPy, classify_scores falls back to per-score lookup if not available
+try:
+    import numpy as np
+    
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 class Category(Enum):
@@ -39,20 +47,55 @@ class Tier(Enum):
     @classmethod
     def from_score(cls, score: int) -> "Tier":
         """Get tier for a given composite score."""
-        for tier in [cls.PIONEER, cls.AUTONOMOUS, cls.RECOGNIZED,
-                     cls.ACTIVE, cls.BECOMING, cls.AWAKENING]:
-            if score >= tier.min_score:
-                return tier
-        return cls.SIGNAL_ZERO
+        # Composites are ints in 0-100; anything else takes the bisect
+        if type(score) is int and 0 <= score <= _MAX_TIER_SCORE:
+            return _TIER_BY_SCORE[score]
+        # NaN compares false against every cutoff, which would bisect it to the top
+        if score != score:
+            return Tier.SIGNAL_ZERO
+        # Scores below the lowest cutoff (including negatives) land on index 0
+        return _TIERS_ASCENDING[bisect_right(_TIER_CUTOFFS, score)]
+
+
+# Tiers from SIGNAL_ZERO up, and the min_score of every tier above SIGNAL_ZERO
+_TIERS_ASCENDING = tuple(sorted(Tier, key=lambda tier: tier.min_score))
+_TIER_CUTOFFS = tuple(tier.min_score for tier in _TIERS_ASCENDING[1:])
+
+# Tier of every whole composite score, indexed by score
+_MAX_TIER_SCORE = 100
+_TIER_BY_SCORE = tuple(
+    _TIERS_ASCENDING[bisect_right(_TIER_CUTOFFS, score)]
+    for score in range(_MAX_TIER_SCORE + 1)
+)
+
+
+def classify_scores(scores: Sequence[float]) -> List[Tier]:
+    """
+    Get the tier of many composite scores at once.
+    
+    Uses one np.searchsorted over all scores when NumPy is available,
+    otherwise Tier.from_score per score.
+    """
+    if not NUMPY_AVAILABLE:
+        return [Tier.from_score(score) for score in scores]
+    values = np.asarray(scores, dtype=np.float64)
+    indices = np.searchsorted(_TIER_CUTOFFS, values, side="right")
+    # searchsorted orders NaN above every cutoff; match from_score instead
+    indices[np.isnan(values)] = 0
+    return [_TIERS_ASCENDING[i] for i in indices.tolist()]
 
 
 # Maximum score for any category
 MAX_CATEGORY_SCORE = 100
 
 
-@dataclass(frozen=True)
-class WeightConfig:
-    """Configuration for a scoring dimension."""
+class WeightConfig(NamedTuple):
+    """
+    Configuration for a scoring dimension.
+    
+    A NamedTuple: immutable, no per-instance dict, and field reads are
+    C-level tuple indexing.
+    """
     max_points: int
     points_per_unit: float
     unit_name: str
@@ -21,11 +21,20 @@ Usage:
     )
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+# Try to import NumPy, batch decay falls back to the scalar path if not available
+try:
+    import numpy as np
+    
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from .constants import Category
 
 
@@ -39,7 +48,52 @@ class DecayRate(Enum):
     COMMUNITY = 1.5   # Community contributions - medium-fast
 
 
-@dataclass
+def _decay_factor(
+    days_since_activity: int,
+    grace_period_days: int,
+    daily_decay_rate: float,
+    max_decay_percent: float,
+    half_life_days: Optional[float],
+    floor: float
+) -> float:
+    """
+    Remaining score multiplier after decay, from plain decay parameters.
+    
+    floor is 1.0 - max_decay_percent / 100.0, passed in so callers can
+    compute it once per config.
+    """
+    # Grace period - no decay for recent activity
+    if days_since_activity <= grace_period_days:
+        return 1.0
+    
+    # Calculate effective decay days
+    effective_days = days_since_activity - grace_period_days
+    
+    if half_life_days:
+        # Half-life formula: decay = 0.5^(days/half_life)
+        decay_multiplier = 0.5 ** (effective_days / half_life_days)
+    else:
+        # Linear decay based on daily rate
+        decay_percent = min(effective_days * daily_decay_rate, max_decay_percent)
+        decay_multiplier = 1.0 - (decay_percent / 100.0)
+    
+    return max(decay_multiplier, floor)
+
+
+@lru_cache(maxsize=65536)
+def _decay_terms(days_since_activity: int, factor_params: tuple) -> Tuple[float, float, float]:
+    """
+    Multiplier, decay percent and rounded multiplier for apply_decay.
+    
+    Depends only on the age in days and the category's parameters, so it
+    is cached: a batch scrape stamps most records with the same fetch
+    time, and every agent then repeats the same few (days, category) keys.
+    """
+    multiplier = _decay_factor(days_since_activity, *factor_params)
+    return multiplier, round((1.0 - multiplier) * 100, 2), round(multiplier, 4)
+
+
+@dataclass(slots=True)
 class DecayConfig:
     """Configuration for score decay calculation."""
     daily_decay_rate: float  # Percentage per day (e.g., 1.0 = 1% per day)
@@ -57,25 +111,17 @@ class DecayConfig:
         Returns:
             Multiplier between 0.5 (max decay) and 1.0 (no decay)
         """
-        # Grace period - no decay for recent activity
-        if days_since_activity <= self.grace_period_days:
-            return 1.0
-        
-        # Calculate effective decay days
-        effective_days = days_since_activity - self.grace_period_days
-        
-        if self.half_life_days:
-            # Half-life formula: decay = 0.5^(days/half_life)
-            decay_multiplier = 0.5 ** (effective_days / self.half_life_days)
-        else:
-            # Linear decay based on daily rate
-            decay_percent = min(
-                effective_days * self.daily_decay_rate,
-                self.max_decay_percent
-            )
-            decay_multiplier = 1.0 - (decay_percent / 100.0)
-        
-        return max(decay_multiplier, 1.0 - (self.max_decay_percent / 100.0))
+        return _decay_factor(days_since_activity, *self.factor_params())
+    
+    def factor_params(self) -> tuple:
+        """Decay parameters in _decay_factor's argument order, after days."""
+        return (
+            self.grace_period_days,
+            self.daily_decay_rate,
+            self.max_decay_percent,
+            self.half_life_days,
+            1.0 - (self.max_decay_percent / 100.0),
+        )
 
 
 # Default decay configurations by category
@@ -119,12 +165,121 @@ DEFAULT_DECAY_CONFIGS = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """
+    Parse an ISO timestamp or bare date, None if it can't be parsed.
+    
+    Cached: platform payloads in a batch repeat the same fetched_at
+    strings, and datetimes are immutable so sharing them is safe.
+    """
+    try:
+        # Handles bare YYYY-MM-DD dates too on Python 3.11+
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    
+    # strptime only adds unpadded dates like 2026-1-5, and "%Y-%m-%d" can
+    # never match more than 10 characters, so skip its much slower parse
+    # (and a second exception) for anything longer
+    if len(timestamp) > 10:
+        return None
+    try:
+        return datetime.strptime(timestamp, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _latest(items: Iterable[dict], key: str, fallback_key: Optional[str] = None) -> Optional[str]:
+    """
+    Latest timestamp across items, None if no item has one.
+    
+    Single pass with no intermediate list. Each item contributes
+    item[key], or item[fallback_key] when that is empty.
+    """
+    latest = None
+    for item in items:
+        value = item.get(key)
+        if not value and fallback_key:
+            value = item.get(fallback_key)
+        if value and (latest is None or value > latest):
+            latest = value
+    return latest
+
+
+def _code_activity(platform_data: dict, data: dict) -> Optional[str]:
+    """GitHub: most recent repo push or update, else profile update."""
+    # Use most recent repo push or commit, fall back to profile updated
+    return _latest(data.get('repos') or (), 'pushed_at', 'updated_at') or data.get('updated_at')
+
+
+def _content_activity(platform_data: dict, data: dict) -> Optional[str]:
+    """dev.to: most recent article publish or edit."""
+    return (_latest(platform_data.get('articles') or (), 'published_at', 'edited_at')
+            or data.get('last_article_at'))
+
+
+def _social_activity(platform_data: dict, data: dict) -> Optional[str]:
+    """X/Twitter: last tweet, else account creation."""
+    return data.get('last_tweet_at') or data.get('created_at')
+
+
+def _economic_activity(platform_data: dict, data: dict) -> Optional[str]:
+    """toku: last completed job, else profile update."""
+    return data.get('last_job_completed_at') or data.get('updated_at')
+
+
+def _community_activity(platform_data: dict, data: dict) -> Optional[str]:
+    """ClawHub/Moltbook: most recent post."""
+    return _latest(data.get('posts') or (), 'created_at') or data.get('last_post_at')
+
+
+def _identity_activity(platform_data: dict, data: dict) -> Optional[str]:
+    """A2A: card update (identity doesn't really decay)."""
+    # Only reached when no fetched timestamp was found, so this keeps the
+    # same falsy fetched value the caller saw
+    return (data.get('card_updated_at')
+            or platform_data.get('fetched') or platform_data.get('fetched_at'))
+
+
+def _raw_score(score_data: Any) -> int:
+    """Raw score from a plain score, a score dict, or a CategoryScore."""
+    if isinstance(score_data, dict):
+        return score_data.get('score', 0)
+    if hasattr(score_data, 'score'):
+        return score_data.score
+    return int(score_data)
+
+
+# Category value -> Category, for apply_decay's string categories
+_CATEGORY_BY_NAME = {category.value: category for category in Category}
+
+# Category -> its value, the key of platform_data and the summary dicts;
+# a dict hit is cheaper than the enum's value descriptor in the hot paths
+_CATEGORY_KEY = {category: category.value for category in Category}
+
+
+# Category -> activity timestamp extractor(platform_data, data)
+_ACTIVITY_EXTRACTORS = {
+    Category.CODE: _code_activity,
+    Category.CONTENT: _content_activity,
+    Category.SOCIAL: _social_activity,
+    Category.ECONOMIC: _economic_activity,
+    Category.COMMUNITY: _community_activity,
+    Category.IDENTITY: _identity_activity,
+}
+
+
 class DecayCalculator:
     """
     Calculates and applies score decay based on data age.
     
     Decay ensures that scores reflect recent activity,
     not just historical achievements.
+    
+    Every decay path reads parameters snapshotted from decay_configs
+    when it is assigned. Assign a new dict to change them; editing the
+    dict or its DecayConfig objects in place has no effect.
     """
     
     def __init__(self, decay_configs: Optional[dict] = None):
@@ -136,32 +291,58 @@ class DecayCalculator:
         """
         self.decay_configs = decay_configs or DEFAULT_DECAY_CONFIGS
     
-    def days_since(self, timestamp: str | datetime) -> int:
+    @property
+    def decay_configs(self) -> dict:
+        """Decay config per category; assigning it rebuilds the parameters."""
+        return self._decay_configs
+    
+    @decay_configs.setter
+    def decay_configs(self, decay_configs: dict):
+        self._decay_configs = decay_configs
+        
+        # Decay parameters are read once here, so the hot paths never touch
+        # the config objects: per-category _decay_factor arguments for
+        # apply_decay, and the same values as parallel arrays in Category
+        # order for apply_decay_batch (a half life of 0 selects linear decay)
+        self._factor_params = {
+            category: self._config_for(category).factor_params() for category in Category
+        }
+        self._category_index = {category: i for i, category in enumerate(Category)}
+        params = list(self._factor_params.values())
+        self._decay_params = tuple(
+            np.array(values, dtype=np.float64) if NUMPY_AVAILABLE else values
+            for values in (
+                [float(grace) for grace, _, _, _, _ in params],
+                [float(rate) for _, rate, _, _, _ in params],
+                [float(max_pct) for _, _, max_pct, _, _ in params],
+                [float(half_life or 0.0) for _, _, _, half_life, _ in params],
+            )
+        )
+    
+    def _config_for(self, category: Category) -> DecayConfig:
+        """Decay config for a category, IDENTITY's default if not configured."""
+        return self.decay_configs.get(category, DEFAULT_DECAY_CONFIGS[Category.IDENTITY])
+    
+    def days_since(self, timestamp: str | datetime, now: Optional[datetime] = None) -> int:
         """
         Calculate days since a timestamp.
         
         Args:
             timestamp: ISO format string or datetime object
+            now: Current local time as from datetime.now(); pass one value
+                when scoring many records instead of re-reading the clock
             
         Returns:
             Number of days (0 for today, positive for past)
         """
         if isinstance(timestamp, str):
-            try:
-                timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            except ValueError:
-                # Try alternative formats
-                try:
-                    timestamp = datetime.strptime(timestamp, "%Y-%m-%d")
-                except ValueError:
-                    return 0  # Can't parse, assume current
-        
-        if timestamp.tzinfo is None:
-            timestamp = timestamp.replace(tzinfo=None)
+            timestamp = _parse_timestamp(timestamp)
+            if timestamp is None:
+                return 0  # Can't parse, assume current
         
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         if timestamp.tzinfo:
-            from datetime import timezone
             now = now.replace(tzinfo=timezone.utc)
         
         delta = now - timestamp
@@ -171,7 +352,8 @@ class DecayCalculator:
         self,
         raw_score: int,
         category: Category | str,
-        last_activity: Optional[str | datetime] = None
+        last_activity: Optional[str | datetime] = None,
+        now: Optional[datetime] = None
     ) -> dict:
         """
         Apply decay to a raw score.
@@ -180,6 +362,7 @@ class DecayCalculator:
             raw_score: The original score (0-100)
             category: The score category
             last_activity: When activity last occurred (ISO timestamp or datetime)
+            now: Current local time, see days_since
             
         Returns:
             Dict with:
@@ -192,40 +375,119 @@ class DecayCalculator:
         """
         # Convert string category to enum if needed
         if isinstance(category, str):
-            try:
-                category = Category(category.lower())
-            except ValueError:
-                category = Category.IDENTITY  # Default fallback
+            category = _CATEGORY_BY_NAME.get(category.lower(), Category.IDENTITY)  # Default fallback
         
-        # Get decay config for this category
-        config = self.decay_configs.get(category, DEFAULT_DECAY_CONFIGS[Category.IDENTITY])
+        # Get decay parameters for this category
+        factor_params = self._factor_params[category]
         
         # Calculate days since activity
         if last_activity is None:
             days_since = 30  # Default: assume 30 days old
         else:
-            days_since = self.days_since(last_activity)
+            days_since = self.days_since(last_activity, now)
         
-        # Calculate decay multiplier
-        multiplier = config.calculate_decay_factor(days_since)
+        # Calculate decay multiplier and the rounded figures reported with it
+        multiplier, decay_percent, rounded_multiplier = _decay_terms(days_since, factor_params)
         
         # Apply decay
         adjusted_score = int(raw_score * multiplier)
         
-        # Calculate actual decay percentage
-        decay_percent = round((1.0 - multiplier) * 100, 2)
-        
         return {
             "adjusted_score": adjusted_score,
             "raw_score": raw_score,
             "decay_percent": decay_percent,
             "days_since_activity": days_since,
-            "multiplier": round(multiplier, 4),
-            "category": category.value,
-            "grace_period_days": config.grace_period_days,
-            "max_decay_percent": config.max_decay_percent,
+            "multiplier": rounded_multiplier,
+            "category": _CATEGORY_KEY[category],
+            "grace_period_days": factor_params[0],
+            "max_decay_percent": factor_params[2],
         }
     
+    def decay_score(
+        self,
+        raw_score: int,
+        category: Category,
+        last_activity: Optional[str | datetime] = None,
+        now: Optional[datetime] = None
+    ) -> Tuple[int, float, int]:
+        """
+        Decay one score, returning only what ScoreCalculator records.
+        
+        Same figures as apply_decay, without building its result dict.
+        
+        Args:
+            raw_score: The original score (0-100)
+            category: The score category
+            last_activity: When activity last occurred (ISO timestamp or datetime)
+            now: Current local time, see days_since
+            
+        Returns:
+            Tuple of (adjusted_score, decay_percent, days_since_activity)
+        """
+        days = 30 if last_activity is None else self.days_since(last_activity, now)
+        multiplier, decay_percent, _ = _decay_terms(days, self._factor_params[category])
+        return int(raw_score * multiplier), decay_percent, days
+    
+    def apply_decay_batch(
+        self,
+        raw_scores: Any,
+        categories: List[Category],
+        days_since: Any
+    ) -> Any:
+        """
+        Apply decay to many scores at once.
+        
+        Column c of raw_scores and days_since belongs to categories[c], so
+        an (agents x categories) matrix is decayed in a few array
+        operations. Adjusted scores match apply_decay exactly.
+        
+        Args:
+            raw_scores: (N, C) original scores
+            categories: Category of each column
+            days_since: (N, C) days since last activity
+            
+        Returns:
+            (N, C) int array of adjusted scores (nested lists without NumPy)
+        """
+        if not NUMPY_AVAILABLE:
+            params = [self._factor_params[category] for category in categories]
+            return [
+                [int(score * _decay_factor(days, *factor_params))
+                 for score, factor_params, days in zip(score_row, params, days_row)]
+                for score_row, days_row in zip(raw_scores, days_since)
+            ]
+        
+        grace, rate, max_pct, half_life = self.decay_arrays(categories)
+        
+        raw_scores = np.ascontiguousarray(raw_scores, dtype=np.float64)
+        days = np.ascontiguousarray(days_since, dtype=np.float64)
+        
+        # Freshly fetched batches are usually inside every grace period,
+        # where the multiplier is exactly 1.0 and decay is a truncation
+        if (days <= grace).all():
+            return raw_scores.astype(np.int64)
+        
+        # Deferred so only batch decay pays for importing Numba
+        from ._kernels import decay_rows
+        
+        return decay_rows(raw_scores, days, grace, rate, max_pct, half_life)
+    
+    def decay_arrays(self, categories: List[Category]) -> Tuple[Any, Any, Any, Any]:
+        """
+        Decay parameters of each category as parallel float64 arrays.
+        
+        A half life of 0 selects linear decay. Requires NumPy.
+        
+        Args:
+            categories: Category of each column
+            
+        Returns:
+            Tuple of (grace, rate, max_pct, half_life) arrays, one entry
+            per category
+        """
+        columns = [self._category_index[category] for category in categories]
+        return tuple(np.take(p, columns) for p in self._decay_params)
+    
     def get_activity_timestamp(
         self,
         platform_data: dict,
@@ -253,48 +515,10 @@ class DecayCalculator:
             return fetched
         
         # Category-specific activity detection
-        data = platform_data.get('data', {})
-        
-        if category == Category.CODE:  # GitHub
-            # Use most recent repo push or commit
-            repos = data.get('repos', [])
-            if repos:
-                dates = [r.get('pushed_at') or r.get('updated_at') for r in repos]
-                dates = [d for d in dates if d]
-                if dates:
-                    return max(dates)
-            # Fall back to profile updated
-            return data.get('updated_at')
-            
-        elif category == Category.CONTENT:  # dev.to
-            articles = platform_data.get('articles', [])
-            if articles:
-                dates = [a.get('published_at') or a.get('edited_at') for a in articles]
-                dates = [d for d in dates if d]
-                if dates:
-                    return max(dates)
-            return data.get('last_article_at')
-            
-        elif category == Category.SOCIAL:  # X/Twitter
-            return data.get('last_tweet_at') or data.get('created_at')
-            
-        elif category == Category.ECONOMIC:  # toku
-            return data.get('last_job_completed_at') or data.get('updated_at')
-            
-        elif category == Category.COMMUNITY:  # ClawHub/Moltbook
-            posts = data.get('posts', [])
-            if posts:
-                dates = [p.get('created_at') for p in posts]
-                dates = [d for d in dates if d]
-                if dates:
-                    return max(dates)
-            return data.get('last_post_at')
-            
-        elif category == Category.IDENTITY:  # A2A
-            # Identity doesn't really decay, but track card updates
-            return data.get('card_updated_at') or fetched
-        
-        return None
+        extractor = _ACTIVITY_EXTRACTORS.get(category)
+        if extractor is None:
+            return None
+        return extractor(platform_data, platform_data.get('data', {}))
     
     def calculate_decay_summary(
         self,
@@ -314,25 +538,20 @@ class DecayCalculator:
         results = {}
         total_raw = 0
         total_adjusted = 0
+        now = datetime.now()
         
         for category, score_data in category_scores.items():
-            # Handle both simple scores and CategoryScore objects
-            if isinstance(score_data, dict):
-                raw_score = score_data.get('score', 0)
-            elif hasattr(score_data, 'score'):
-                raw_score = score_data.score
-            else:
-                raw_score = int(score_data)
+            raw_score = _raw_score(score_data)
             
             # Get activity timestamp from platform data
             activity = self.get_activity_timestamp(
-                platform_data.get(category.value, {}),
+                platform_data.get(_CATEGORY_KEY[category], {}),
                 category
             )
             
             # Apply decay
-            decay_result = self.apply_decay(raw_score, category, activity)
-            results[category.value] = decay_result
+            decay_result = self.apply_decay(raw_score, category, activity, now)
+            results[_CATEGORY_KEY[category]] = decay_result
             
             total_raw += raw_score
             total_adjusted += decay_result['adjusted_score']
@@ -349,9 +568,53 @@ class DecayCalculator:
                 "total_raw_score": total_raw,
                 "total_adjusted_score": total_adjusted,
                 "overall_decay_percent": overall_decay,
-                "calculated_at": datetime.now().isoformat(),
+                "calculated_at": now.isoformat(),
             }
         }
+    
+    def calculate_decay_summary_fast(
+        self,
+        category_scores: dict,
+        platform_data: dict
+    ) -> Tuple[List[int], int, int]:
+        """
+        Decay totals only, for ranking passes that discard the details.
+        
+        Same adjusted scores and totals as calculate_decay_summary, without
+        building a detail dict per category or rounding anything.
+        
+        Args:
+            category_scores: Dict mapping Category to raw score values
+            platform_data: Raw platform data for activity timestamps
+            
+        Returns:
+            Tuple of (adjusted scores in category_scores order,
+            total raw score, total adjusted score)
+        """
+        adjusted_scores = []
+        total_raw = 0
+        total_adjusted = 0
+        now = datetime.now()
+        
+        for category, score_data in category_scores.items():
+            raw_score = _raw_score(score_data)
+            activity = self.get_activity_timestamp(
+                platform_data.get(_CATEGORY_KEY[category], {}),
+                category
+            )
+            days = 30 if activity is None else self.days_since(activity, now)
+            factor_params = self._factor_params[category]
+            if days <= factor_params[0]:
+                # Inside the grace period, no decay
+                adjusted = int(raw_score)
+            else:
+                adjusted = int(raw_score * _decay_factor(days, *factor_params))
+            
+            adjusted_scores.append(adjusted)
+            total_raw += raw_score
+            total_adjusted += adjusted
+        
+        return adjusted_scores, total_raw, total_adjusted
 
 
 # Convenience function for simple use cases
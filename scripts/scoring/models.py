@@ -4,14 +4,23 @@ Data models for the scoring system.
 Uses dataclasses for clean, type-safe score representation.
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+
+# Try to import orjson, fall back to the json module if not available
+try:
+    import orjson
+    
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .constants import Category, Tier
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryScore:
     """
     Score breakdown for a single category.
@@ -22,7 +31,8 @@ class CategoryScore:
         raw_score: Calculated score before capping at max
         max_score: Maximum possible for this category (usually 100)
         breakdown: Dict of individual component scores
-        data_sources: List of data sources used
+        data_sources: Data sources used (shared tuple, treat as read-only;
+            to_dict() emits a list, like ScoreResult's)
         notes: Optional notes about calculation
     """
     category: Category
@@ -30,13 +40,40 @@ class CategoryScore:
     raw_score: float = 0.0
     max_score: int = 100
     breakdown: Dict[str, float] = field(default_factory=dict)
-    data_sources: List[str] = field(default_factory=list)
+    data_sources: Tuple[str, ...] = ()
     notes: Optional[str] = None
     
     def __post_init__(self):
         """Ensure score is capped at max_score."""
         self.score = min(int(self.score), self.max_score)
     
+    @classmethod
+    def _make(
+        cls,
+        category: Category,
+        score: int,
+        raw_score: float = 0.0,
+        max_score: int = 100,
+        breakdown: Optional[Dict[str, float]] = None,
+        data_sources: Tuple[str, ...] = (),
+        notes: Optional[str] = None
+    ) -> "CategoryScore":
+        """
+        Fast constructor for calculators.
+        
+        Skips the generated __init__ and __post_init__, so the caller
+        must pass a score that is already an int capped at max_score.
+        """
+        inst = cls.__new__(cls)
+        inst.category = category
+        inst.score = score
+        inst.raw_score = raw_score
+        inst.max_score = max_score
+        inst.breakdown = {} if breakdown is None else breakdown
+        inst.data_sources = data_sources
+        inst.notes = notes
+        return inst
+    
     @property
     def percentage(self) -> float:
         """Score as a percentage of max."""
@@ -52,12 +89,12 @@ class CategoryScore:
             "max_score": self.max_score,
             "percentage": round(self.percentage, 2),
             "breakdown": self.breakdown,
-            "data_sources": self.data_sources,
+            "data_sources": list(self.data_sources),
             "notes": self.notes,
         }
 
 
-@dataclass  
+@dataclass(slots=True)
 class ScoreResult:
     """
     Complete scoring result for an agent.
@@ -98,7 +135,7 @@ class ScoreResult:
         return 0
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization (see dumps_results for bulk exports)."""
         return {
             "handle": self.handle,
             "name": self.name,
@@ -115,7 +152,7 @@ class ScoreResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformData:
     """
     Raw data from a platform for scoring.
@@ -143,4 +180,44 @@ class PlatformData:
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the data dict."""
-        return self.data.get(key, default)
\ No newline at end of file
+        return self.data.get(key, default)
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for scoring objects, as they appear in to_dict()."""
+    if isinstance(obj, (ScoreResult, CategoryScore)):
+        return obj.to_dict()
+    if isinstance(obj, Tier):
+        return obj.label
+    if isinstance(obj, Category):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_results(results: Iterable[ScoreResult]) -> bytes:
+    """
+    Serialize many results as JSON lines, one to_dict() object per line.
+    
+    Uses orjson when available, which encodes the nested dicts several
+    times faster than the json module for bulk leaderboard exports.
+    
+    Args:
+        results: Results to serialize
+        
+    Returns:
+        UTF-8 encoded JSON lines, each ending in a newline
+    """
+    if ORJSON_AVAILABLE:
+        # Passthrough keeps dataclasses and datetimes on _json_default, so
+        # the output has the same shape and timestamps as to_dict()
+        options = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        return b"".join(
+            orjson.dumps(result, default=_json_default, option=options) + b"\n"
+            for result in results
+        )
+    return "".join(
+        json.dumps(result, default=_json_default, ensure_ascii=False) + "\n"
+        for result in results
+    ).encode("utf-8")
@@ -5,25 +5,49 @@ Aggregates category scores into composite score with proper weighting.
 Includes optional time-based decay to encourage continuous activity.
 """
 
+import os
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+# Try to import NumPy, batch composites fall back to plain Python if not available
+try:
+    import numpy as np
+    
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from .constants import Category, Tier, COMPOSITE_WEIGHTS
 from .models import ScoreResult, CategoryScore, PlatformData
 from .calculators import (
-    MentoringScoreCalculator,
-    CodeScoreCalculator,
-    ContentScoreCalculator,
-    IdentityScoreCalculator,
-    SocialScoreCalculator,
-    EconomicScoreCalculator,
-    CommunityScoreCalculator,
-    ToolsScoreCalculator,
+    MENTORING_CALCULATOR,
+    CODE_CALCULATOR,
+    CONTENT_CALCULATOR,
+    IDENTITY_CALCULATOR,
+    SOCIAL_CALCULATOR,
+    ECONOMIC_CALCULATOR,
+    COMMUNITY_CALCULATOR,
+    TOOLS_CALCULATOR,
 )
 from .decay import DecayCalculator
 from .skills_boost import SkillsBoostCalculator
 
 
+# Map platform names to categories
+_PLATFORM_TO_CATEGORY: Dict[str, Category] = {
+    "github": Category.CODE,
+    "devto": Category.CONTENT,
+    "blog": Category.CONTENT,
+    "a2a": Category.IDENTITY,
+    "domain": Category.IDENTITY,
+    "x": Category.SOCIAL,
+    "twitter": Category.SOCIAL,
+    "toku": Category.ECONOMIC,
+    "clawhub": Category.COMMUNITY,
+    "moltbook": Category.MENTORING,
+    "tools": Category.TOOLS,
+}
+
 class ScoreCalculator:
     """
     Orchestrates the full scoring pipeline.
@@ -62,23 +86,42 @@ class ScoreCalculator:
             decay_configs: Optional custom decay configurations per category
             apply_skills_boost: Whether to apply skills-based boost to composite score
         """
+        # Constructor arguments, so calculate_many can rebuild this
+        # calculator in its worker processes
+        self._config = (custom_weights, apply_decay, decay_configs, apply_skills_boost)
         self.weights = custom_weights or COMPOSITE_WEIGHTS
+        # Composite weight of every category, defaults filled in, so
+        # calculate_composite does one plain lookup per category; and the
+        # same weights in Category order for calculate_composite_batch
+        self._category_weights = {category: self.weights.get(category, 1.0) for category in Category}
+        self._weight_vector = tuple(self._category_weights.values())
+        # (breakdown key, weight) per category, one lookup per composite term
+        self._composite_terms = {
+            category: (category.value, weight) for category, weight in self._category_weights.items()
+        }
         self.apply_decay = apply_decay
         self.decay_calculator = DecayCalculator(decay_configs) if apply_decay else None
         self.apply_skills_boost = apply_skills_boost
         self.skills_boost_calculator = SkillsBoostCalculator() if apply_skills_boost else None
         
-        # Initialize category calculators
+        # Category calculators (shared default-weight instances)
         self.calculators = {
-            Category.CODE: CodeScoreCalculator(),
-            Category.CONTENT: ContentScoreCalculator(),
-            Category.IDENTITY: IdentityScoreCalculator(),
-            Category.SOCIAL: SocialScoreCalculator(),
-            Category.ECONOMIC: EconomicScoreCalculator(),
-            Category.COMMUNITY: CommunityScoreCalculator(),
-            Category.MENTORING: MentoringScoreCalculator(),
-            Category.TOOLS: ToolsScoreCalculator(),
+            Category.CODE: CODE_CALCULATOR,
+            Category.CONTENT: CONTENT_CALCULATOR,
+            Category.IDENTITY: IDENTITY_CALCULATOR,
+            Category.SOCIAL: SOCIAL_CALCULATOR,
+            Category.ECONOMIC: ECONOMIC_CALCULATOR,
+            Category.COMMUNITY: COMMUNITY_CALCULATOR,
+            Category.MENTORING: MENTORING_CALCULATOR,
+            Category.TOOLS: TOOLS_CALCULATOR,
         }
+        
+        # (category, bound calculate) in Category order, so calculate()
+        # dispatches straight to each calculator instead of looking it up
+        # through calculate_category for every category of every agent
+        self._category_dispatch = tuple(
+            (category, self.calculators[category].calculate) for category in Category
+        )
     
     def calculate_category(
         self,
@@ -121,16 +164,18 @@ class ScoreCalculator:
         total_weighted = 0.0
         total_weight = 0.0
         breakdown = {}
+        composite_terms = self._composite_terms
         
         for category, cat_score in category_scores.items():
-            weight = self.weights.get(category, 1.0)
-            weighted = cat_score.score * weight
+            score = cat_score.score
+            key, weight = composite_terms[category]
+            weighted = score * weight
             
             total_weighted += weighted
             total_weight += weight
             
-            breakdown[category.value] = {
-                "score": cat_score.score,
+            breakdown[key] = {
+                "score": score,
                 "weight": weight,
                 "weighted": weighted,
             }
@@ -146,12 +191,93 @@ class ScoreCalculator:
         
         return composite, breakdown
     
+    def calculate_composite_batch(self, scores: Any) -> Any:
+        """
+        Weighted composites for many agents at once.
+        
+        Each row gives the same composite as calculate_composite on a full
+        set of category scores: weighted sums are accumulated in Category
+        order and rounded the same way, so results match exactly.
+        
+        Args:
+            scores: (N, C) category scores, one column per Category in
+                enum order
+            
+        Returns:
+            int array of N composite scores (list without NumPy)
+        """
+        weights = self._weight_vector
+        total_weight = 0.0
+        for weight in weights:
+            total_weight += weight
+        
+        if not NUMPY_AVAILABLE:
+            composites = []
+            for row in scores:
+                total_weighted = 0.0
+                for score, weight in zip(row, weights):
+                    total_weighted += score * weight
+                composites.append(round(total_weighted / total_weight) if total_weight else 0)
+            return composites
+        
+        scores = np.asarray(scores, dtype=np.float64)
+        if not total_weight:
+            return np.zeros(len(scores), dtype=np.int64)
+        total_weighted = scores[:, 0] * weights[0]
+        for c in range(1, len(weights)):
+            total_weighted += scores[:, c] * weights[c]
+        # np.rint rounds half to even, like round()
+        return np.rint(total_weighted / total_weight).astype(np.int64)
+    
+    def calculate_decayed_composite_batch(self, raw_scores: Any, days_since: Any) -> Any:
+        """
+        Decayed category scores and their composites for many agents.
+        
+        Fuses apply_decay_batch and calculate_composite_batch into one
+        pass over the (N, C) scores, with no per-category result dicts.
+        Results match calculate() before the skills boost; use
+        DecayCalculator.apply_decay for the per-category decay details.
+        
+        Args:
+            raw_scores: (N, C) raw category scores, one column per
+                Category in enum order
+            days_since: (N, C) days since last activity, same layout
+            
+        Returns:
+            Tuple of ((N, C) adjusted scores, N composite scores); nested
+            lists without NumPy
+        """
+        categories = list(Category)
+        if not (self.apply_decay and self.decay_calculator):
+            adjusted = (np.asarray(raw_scores, dtype=np.float64).astype(np.int64)
+                        if NUMPY_AVAILABLE else [[int(score) for score in row] for row in raw_scores])
+            return adjusted, self.calculate_composite_batch(adjusted)
+        
+        total_weight = 0.0
+        for weight in self._weight_vector:
+            total_weight += weight
+        if not NUMPY_AVAILABLE or not total_weight:
+            adjusted = self.decay_calculator.apply_decay_batch(raw_scores, categories, days_since)
+            return adjusted, self.calculate_composite_batch(adjusted)
+        
+        # The fused kernel's module pulls in Numba; load it on first use
+        from ._kernels import decay_composite_rows
+        
+        return decay_composite_rows(
+            np.ascontiguousarray(raw_scores, dtype=np.float64),
+            np.ascontiguousarray(days_since, dtype=np.float64),
+            *self.decay_calculator.decay_arrays(categories),
+            np.array(self._weight_vector, dtype=np.float64),
+            total_weight
+        )
+    
     def calculate(
         self,
         handle: str,
         name: str,
         platform_data: Dict[str, PlatformData],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None
     ) -> ScoreResult:
         """
         Calculate complete score for an agent.
@@ -161,79 +287,68 @@ class ScoreCalculator:
             name: Display name
             platform_data: Dict mapping platform names to PlatformData
             metadata: Optional additional data
+            now: Current local time for decay (defaults to datetime.now())
             
         Returns:
             Complete ScoreResult with composite score and tier
         """
-        # Map platform names to categories
-        platform_to_category = {
-            "github": Category.CODE,
-            "devto": Category.CONTENT,
-            "blog": Category.CONTENT,
-            "a2a": Category.IDENTITY,
-            "domain": Category.IDENTITY,
-            "x": Category.SOCIAL,
-            "twitter": Category.SOCIAL,
-            "toku": Category.ECONOMIC,
-            "clawhub": Category.COMMUNITY,
-            "moltbook": Category.MENTORING,
-            "tools": Category.TOOLS,
-            
-            
-            
-            
-        }
-        
         # Aggregate platform data by category
         # For now, each category gets its primary platform data
         category_data: Dict[Category, PlatformData] = {}
         
         for platform_name, data in platform_data.items():
-            category = platform_to_category.get(platform_name)
+            category = _PLATFORM_TO_CATEGORY.get(platform_name)
             if category:
                 category_data[category] = data
-                category_data[category].data["platform_name"] = platform_name
         
         # Calculate individual category scores
         category_scores: Dict[Category, CategoryScore] = {}
-        all_data_sources: List[str] = []
+        all_data_sources: Set[str] = set()
         decay_info: Dict[str, Any] = {}
+        # One clock read for every category's decay
+        if now is None:
+            now = datetime.now()
         
-        for category in Category:
-            data = category_data.get(category, PlatformData(
-                platform=category.value,
-                status="unavailable"
-            ))
+        for category, calculate_score in self._category_dispatch:
+            data = category_data.get(category)
+            if data is None:
+                # Built per call and fetched as of now, so a category the
+                # agent has no platform for never shows decay
+                data = PlatformData(platform=category.value, status="unavailable", fetched_at=now)
             
-            score = self.calculate_category(category, data)
+            score = calculate_score(data)
             
             # Apply decay if enabled
             if self.apply_decay and self.decay_calculator:
+                # fetched_at is passed as a datetime: days_since takes it
+                # as-is, where an isoformat() string would be parsed back
                 activity_time = self.decay_calculator.get_activity_timestamp(
-                    {"data": data.data, "fetched": data.fetched_at.isoformat() if data.fetched_at else None},
+                    {"data": data.data, "fetched": data.fetched_at},
                     category
                 )
                 
-                decay_result = self.decay_calculator.apply_decay(
-                    score.score,
+                raw_score = score.score
+                adjusted_score, decay_percent, days_since_activity = self.decay_calculator.decay_score(
+                    raw_score,
                     category,
-                    activity_time
+                    activity_time,
+                    now
                 )
                 
                 # Update score with decayed value
-                score.score = decay_result['adjusted_score']
-                score.notes = (score.notes or "") + f" | Decay: {decay_result['decay_percent']}% over {decay_result['days_since_activity']} days"
+                score.score = adjusted_score
+                score.notes = (score.notes or "") + f" | Decay: {decay_percent}% over {days_since_activity} days"
                 
                 # Store decay info for metadata
                 decay_info[category.value] = {
-                    "raw_score": decay_result['raw_score'],
-                    "decayed_score": decay_result['adjusted_score'],
-                    "decay_percent": decay_result['decay_percent'],
-                    "days_since_activity": decay_result['days_since_activity'],
+                    "raw_score": raw_score,
+                    "decayed_score": adjusted_score,
+                    "decay_percent": decay_percent,
+                    "days_since_activity": days_since_activity,
                 }
             
             category_scores[category] = score
-            all_data_sources.extend(score.data_sources)
+            all_data_sources.update(score.data_sources)
         
         # Calculate composite score
         composite, composite_breakdown = self.calculate_composite(category_scores)
@@ -259,8 +374,8 @@ class ScoreCalculator:
         # Determine tier from final score
         tier = Tier.from_score(final_score)
         
-        # Remove duplicates from data sources
-        data_sources = list(set(all_data_sources))
+        # Sorted so the list doesn't depend on string hash order
+        data_sources = sorted(all_data_sources)
         
         return ScoreResult(
             handle=handle,
@@ -272,15 +387,41 @@ class ScoreCalculator:
             metadata=meta,
         )
     
+    def calculate_batch(
+        self,
+        agents: Iterable[Tuple[str, str, Dict[str, PlatformData]]]
+    ) -> List[ScoreResult]:
+        """
+        Calculate complete scores for many agents.
+        
+        Every agent is decayed against the same clock reading, so a batch
+        is scored consistently however long it takes. Each result is
+        identical to calculate() at that time.
+        
+        Args:
+            agents: (handle, name, platform_data) per agent
+            
+        Returns:
+            One ScoreResult per agent, in order
+        """
+        now = datetime.now()
+        calculate = self.calculate
+        return [
+            calculate(handle, name, platform_data, now=now)
+            for handle, name, platform_data in agents
+        ]
+    
     def calculate_from_profile(
         self,
-        profile_data: Dict[str, Any]
+        profile_data: Dict[str, Any],
+        now: Optional[datetime] = None
     ) -> ScoreResult:
         """
         Calculate score from a profile data dict (legacy format).
         
         Args:
             profile_data: Profile data in old format from JSON files
+            now: Current local time for decay (defaults to datetime.now())
             
         Returns:
             Complete ScoreResult
@@ -301,4 +442,59 @@ class ScoreCalculator:
                     data=data
                 )
         
-        return self.calculate(handle, name, platform_data)
\ No newline at end of file
+        return self.calculate(handle, name, platform_data, now=now)
+    
+    def calculate_many(
+        self,
+        profiles: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[ScoreResult]:
+        """
+        Score many legacy-format profiles in parallel.
+        
+        Profiles are independent, so they are spread over a process pool
+        like calculators.score_batch does. Each worker builds its own
+        calculator with this one's settings once, and every profile is
+        decayed against the same clock reading.
+        
+        Args:
+            profiles: Profile data dicts, as for calculate_from_profile
+            max_workers: Worker processes to use (default: CPU count);
+                1 scores inline without starting a pool
+            
+        Returns:
+            One ScoreResult per profile, in the same order as the input
+        """
+        now = datetime.now()
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1 or len(profiles) <= 1:
+            return [self.calculate_from_profile(profile, now) for profile in profiles]
+        
+        # Imported here: multiprocessing is a heavy import and only bulk
+        # scoring needs it
+        from concurrent.futures import ProcessPoolExecutor
+        
+        chunksize = max(1, len(profiles) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._config, now)
+        ) as ex:
+            return list(ex.map(_score_profile, profiles, chunksize=chunksize))
+
+
+# Per-process state for calculate_many, set up once by _init_worker
+_WORKER_CALCULATOR: Optional[ScoreCalculator] = None
+_WORKER_NOW: Optional[datetime] = None
+
+
+def _init_worker(config: Tuple[Any, ...], now: datetime) -> None:
+    """Build the worker process's calculator from ScoreCalculator settings."""
+    global _WORKER_CALCULATOR, _WORKER_NOW
+    _WORKER_CALCULATOR = ScoreCalculator(*config)
+    _WORKER_NOW = now
+
+
+def _score_profile(profile_data: Dict[str, Any]) -> ScoreResult:
+    """Score a single profile inside a worker process."""
+    return _WORKER_CALCULATOR.calculate_from_profile(profile_data, _WORKER_NOW)
@@ -12,11 +12,23 @@ Boost Philosophy:
 - Capped to prevent gaming the system
 """
 
-from typing import Dict, Any, Optional
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional
 import json
 import os
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+import tempfile
+import threading
+import time
+from urllib.parse import quote
+
+# Try to import orjson for parsing profiles, fall back to json if not available
+try:
+    import orjson
+    
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
     from .models import CategoryScore
@@ -27,6 +39,53 @@ except ImportError:
     from constants import Category
 
 
+# Marks a lazily loaded value that hasn't been loaded yet
+_UNSET = object()
+
+# Parses JSON from bytes; both accept a UTF-8 payload without decoding it
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Shared keep-alive client for Moltbook requests, created on first use.
+# Tagged with the creating process so a forked worker opens its own
+# connections instead of sharing the parent's sockets
+_HTTP_CLIENT = None
+_HTTP_CLIENT_PID: Optional[int] = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+# Whether httpx is installed; None until the first request tries to import it
+HTTPX_AVAILABLE: Optional[bool] = None
+
+
+def _http_client() -> Optional["httpx.Client"]:
+    """
+    Get this process's pooled HTTP client, creating it if needed.
+    
+    httpx (with ssl and http.client) is imported here on first use rather
+    than with this module, so scoring without Moltbook never loads it.
+    
+    Returns:
+        The client, or None if httpx isn't installed (use urllib instead)
+    """
+    global _HTTP_CLIENT, _HTTP_CLIENT_PID, HTTPX_AVAILABLE
+    with _HTTP_CLIENT_LOCK:
+        if HTTPX_AVAILABLE is False:
+            return None
+        if _HTTP_CLIENT is None or _HTTP_CLIENT_PID != os.getpid():
+            try:
+                import httpx
+            except ImportError:
+                HTTPX_AVAILABLE = False
+                return None
+            HTTPX_AVAILABLE = True
+            _HTTP_CLIENT = httpx.Client(
+                timeout=10,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+            )
+            _HTTP_CLIENT_PID = os.getpid()
+        return _HTTP_CLIENT
+
+
 class SkillsBoostCalculator:
     """
     Calculate and apply skills-based boost to agent scores.
@@ -66,48 +125,158 @@ class SkillsBoostCalculator:
         (11, 999, 1.12),  # Expert (capped)
     ]
     
+    # Moltbook activity scoring: breakdown key -> (profile field,
+    # thresholds, points). A value scores points[i], where i is the
+    # number of thresholds it reaches
+    MOLTBOOK_METRICS = {
+        "karma": ("karma", (1, 101, 501), (0, 0.5, 1.0, 1.5)),
+        "followers": ("follower_count", (1, 11, 51), (0, 0.25, 0.5, 1.0)),
+        "posts": ("posts_count", (1, 6, 21), (0, 0.25, 0.5, 1.0)),
+        "comments": ("comments_count", (1, 21, 101), (0, 0.25, 0.5, 1.0)),
+    }
+    
+    # Enum member lookups go through a descriptor; read this one once
+    _IDENTITY = Category.IDENTITY
+    
     # Moltbook API configuration
     MOLTBOOK_API_BASE = "https://www.moltbook.com/api/v1"
     
+    # Fetched profiles are kept on disk for this long (seconds), when a
+    # cache directory is configured
+    DEFAULT_MOLTBOOK_CACHE_TTL = 86400
+    
+    # Environment variable naming the profile cache directory, used when
+    # no moltbook_cache_dir is passed; unset means no disk cache
+    MOLTBOOK_CACHE_DIR_ENV = "AGENTFOLIO_MOLTBOOK_CACHE_DIR"
+    
+    # Most profiles prefetch() keeps per instance; the least recently used go first
+    PROFILE_CACHE_SIZE = 1024
+    
+    # API key from the credentials files, shared by all instances; _UNSET
+    # until a file has supplied one, so a key added later is still found
+    _KEY_CACHE: Any = _UNSET
+    
     def __init__(self, moltbook_api_key: Optional[str] = None, 
-                 moltbook_username: Optional[str] = None):
+                 moltbook_username: Optional[str] = None,
+                 moltbook_cache_dir: Optional[str] = None,
+                 moltbook_cache_ttl: float = DEFAULT_MOLTBOOK_CACHE_TTL):
         """
         Initialize the skills boost calculator.
         
         Args:
             moltbook_api_key: Optional Moltbook API key
             moltbook_username: Optional Moltbook agent username to fetch
+            moltbook_cache_dir: Directory for cached Moltbook profiles (defaults to
+                $AGENTFOLIO_MOLTBOOK_CACHE_DIR; profiles aren't cached on disk if neither is set)
+            moltbook_cache_ttl: Seconds a cached profile stays fresh (0 disables the cache)
         """
         self._moltbook_api_key = moltbook_api_key
         self._moltbook_username = moltbook_username
         self._cached_moltbook_data: Optional[Dict] = None
+        # Profiles fetched by prefetch(), by username, least recently used first
+        self._profile_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self.moltbook_cache_dir = moltbook_cache_dir or os.environ.get(self.MOLTBOOK_CACHE_DIR_ENV)
+        self.moltbook_cache_ttl = moltbook_cache_ttl
+        # Multiplier for each whole point count up to the top tier's minimum,
+        # which covers every count above it too
+        top = self.BOOST_TIERS[-1][0]
+        self._multiplier_table = tuple(self._scan_tiers(points) for points in range(top + 1))
     
     def _load_moltbook_key(self) -> Optional[str]:
         """Load Moltbook API key from credentials."""
         if self._moltbook_api_key:
             return self._moltbook_api_key
-            
+        
+        # Once a key is found the credentials files aren't read again;
+        # until then every lookup retries them
+        if SkillsBoostCalculator._KEY_CACHE is _UNSET:
+            key = self._read_moltbook_key()
+            if key is None:
+                return None
+            SkillsBoostCalculator._KEY_CACHE = key
+        return SkillsBoostCalculator._KEY_CACHE
+    
+    @staticmethod
+    def _read_moltbook_key() -> Optional[str]:
+        """Read Moltbook API key from the first credentials file that has one."""
         creds_paths = [
             os.path.expanduser("~/.config/moltbook/credentials.json"),
             os.path.expanduser("~/.openclaw/auth-profiles.json"),
         ]
         for path in creds_paths:
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r') as f:
-                        creds = json.load(f)
-                        # Try different key locations
-                        key = creds.get('api_key') or \
-                              creds.get('moltbook', {}).get('api_key')
-                        if key:
-                            return key
-                except Exception:
-                    pass
+            # A missing file fails the open, so no separate exists() check
+            try:
+                with open(path, 'rb') as f:
+                    creds = _json_loads(f.read())
+                    # Try different key locations
+                    key = creds.get('api_key') or \
+                          creds.get('moltbook', {}).get('api_key')
+                    if key:
+                        return key
+            except Exception:
+                pass
         return None
     
+    def _get_cache_path(self, username: str) -> str:
+        """Get the cache file path for a Moltbook username."""
+        return os.path.join(self.moltbook_cache_dir, f"{quote(username, safe='')}.json")
+    
+    def _load_cached_profile(self, username: str) -> Optional[Dict]:
+        """Load a cached Moltbook profile if not expired."""
+        if not self.moltbook_cache_dir or self.moltbook_cache_ttl <= 0:
+            return None
+        
+        cache_path = self._get_cache_path(username)
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.moltbook_cache_ttl:
+                return None  # Cache expired
+            with open(cache_path, 'rb') as f:
+                return _json_loads(f.read())
+        except Exception:
+            return None
+    
+    def _save_cached_profile(self, username: str, profile: Dict):
+        """Save a Moltbook profile to the cache."""
+        if not self.moltbook_cache_dir or self.moltbook_cache_ttl <= 0:
+            return
+        
+        try:
+            os.makedirs(self.moltbook_cache_dir, exist_ok=True)
+            # Write to a temp file and rename it into place, so concurrent
+            # scorers never read a half-written profile
+            fd, tmp_path = tempfile.mkstemp(dir=self.moltbook_cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(profile, f)
+                os.replace(tmp_path, self._get_cache_path(username))
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception:
+            pass
+    
     def _fetch_moltbook_profile(self, username: str) -> Optional[Dict]:
         """
-        Fetch agent profile from Moltbook API.
+        Fetch agent profile from Moltbook API, via the on-disk cache.
+        
+        Args:
+            username: Moltbook agent username
+            
+        Returns:
+            Profile data dict or None if unavailable
+        """
+        profile = self._load_cached_profile(username)
+        if profile is not None:
+            return profile
+        
+        profile = self._request_moltbook_profile(username)
+        if profile is not None:
+            self._save_cached_profile(username, profile)
+        return profile
+    
+    def _request_moltbook_profile(self, username: str) -> Optional[Dict]:
+        """
+        Request agent profile from the Moltbook API.
         
         Args:
             username: Moltbook agent username
@@ -121,21 +290,62 @@ class SkillsBoostCalculator:
         
         try:
             url = f"{self.MOLTBOOK_API_BASE}/agents/profile?name={username}"
-            req = Request(url, headers={
+            headers = {
                 "Authorization": f"Bearer {api_key}",
                 "Accept": "application/json",
                 "User-Agent": "AgentFolio/2.0"
-            })
+            }
+            
+            client = _http_client()
+            if client is not None:
+                # Reuses an open connection instead of a new TLS handshake
+                response = client.get(url, headers=headers)
+                response.raise_for_status()
+                data = _json_loads(response.content)
+            else:
+                # Imported here, like httpx in _http_client: urllib.request
+                # pulls in http.client and ssl, and only a request made
+                # without httpx needs it
+                from urllib.request import urlopen, Request
+                
+                with urlopen(Request(url, headers=headers), timeout=10) as response:
+                    data = _json_loads(response.read())
             
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                if data.get('success') and data.get('agent'):
-                    return data['agent']
+            if data.get('success') and data.get('agent'):
+                return data['agent']
         except Exception:
             pass
         
         return None
     
+    def prefetch(self, usernames: Iterable[str], max_workers: int = 16):
+        """
+        Fetch many Moltbook profiles concurrently ahead of scoring.
+        
+        Fetches are I/O-bound, so a thread pool overlaps their network
+        latency. Fetched profiles are kept for
+        _calculate_moltbook_skill_points, up to PROFILE_CACHE_SIZE of
+        them; usernames already prefetched are skipped, and unavailable
+        profiles are not kept, so scoring retries them.
+        
+        Args:
+            usernames: Moltbook agent usernames to fetch
+            max_workers: Concurrent fetches
+        """
+        pending = [name for name in dict.fromkeys(usernames)
+                   if name and name not in self._profile_cache]
+        if not pending:
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as ex:
+            for username, profile in zip(pending, ex.map(self._fetch_moltbook_profile, pending)):
+                if profile is not None:
+                    self._profile_cache[username] = profile
+                    if len(self._profile_cache) > self.PROFILE_CACHE_SIZE:
+                        self._profile_cache.popitem(last=False)
+    
     def _calculate_moltbook_skill_points(self, username: str) -> Dict[str, Any]:
         """
         Calculate skill points based on Moltbook activity metrics.
@@ -156,8 +366,11 @@ class SkillsBoostCalculator:
         if not username:
             return {"points": 0, "breakdown": {}, "raw": None}
         
-        # Check cache first
-        if self._cached_moltbook_data is not None:
+        # Check caches first
+        if username in self._profile_cache:
+            self._profile_cache.move_to_end(username)
+            profile = self._profile_cache[username]
+        elif self._cached_moltbook_data is not None:
             profile = self._cached_moltbook_data
         else:
             profile = self._fetch_moltbook_profile(username)
@@ -168,58 +381,15 @@ class SkillsBoostCalculator:
         
         points = 0.0
         breakdown = {}
+        raw = {}
         
-        # Karma scoring
-        karma = profile.get('karma', 0)
-        if karma >= 501:
-            karma_pts = 1.5
-        elif karma >= 101:
-            karma_pts = 1.0
-        elif karma >= 1:
-            karma_pts = 0.5
-        else:
-            karma_pts = 0
-        points += karma_pts
-        breakdown['karma'] = {"raw": karma, "points": karma_pts}
-        
-        # Follower scoring
-        followers = profile.get('follower_count', 0)
-        if followers >= 51:
-            follower_pts = 1.0
-        elif followers >= 11:
-            follower_pts = 0.5
-        elif followers >= 1:
-            follower_pts = 0.25
-        else:
-            follower_pts = 0
-        points += follower_pts
-        breakdown['followers'] = {"raw": followers, "points": follower_pts}
-        
-        # Posts scoring
-        posts = profile.get('posts_count', 0)
-        if posts >= 21:
-            posts_pts = 1.0
-        elif posts >= 6:
-            posts_pts = 0.5
-        elif posts >= 1:
-            posts_pts = 0.25
-        else:
-            posts_pts = 0
-        points += posts_pts
-        breakdown['posts'] = {"raw": posts, "points": posts_pts}
-        
-        # Comments scoring
-        comments = profile.get('comments_count', 0)
-        if comments >= 101:
-            comments_pts = 1.0
-        elif comments >= 21:
-            comments_pts = 0.5
-        elif comments >= 1:
-            comments_pts = 0.25
-        else:
-            comments_pts = 0
-        points += comments_pts
-        breakdown['comments'] = {"raw": comments, "points": comments_pts}
+        # Karma, follower, posts and comments scoring
+        for metric, (field, thresholds, metric_points) in self.MOLTBOOK_METRICS.items():
+            value = profile.get(field, 0)
+            metric_pts = metric_points[bisect_right(thresholds, value)]
+            points += metric_pts
+            breakdown[metric] = {"raw": value, "points": metric_pts}
+            raw[field] = value
         
         # Verified bonus
         is_verified = profile.get('is_verified', False)
@@ -231,10 +401,7 @@ class SkillsBoostCalculator:
             "points": round(points, 2),
             "breakdown": breakdown,
             "raw": {
-                "karma": karma,
-                "follower_count": followers,
-                "posts_count": posts,
-                "comments_count": comments,
+                **raw,
                 "is_verified": is_verified,
                 "is_active": profile.get('is_active', False),
             }
@@ -250,19 +417,15 @@ class SkillsBoostCalculator:
         Returns:
             Number of skills found in A2A card, or 0 if not available
         """
-        identity_score = category_scores.get(Category.IDENTITY)
-        if not identity_score:
-            return 0
-        
+        identity_score = category_scores.get(self._IDENTITY)
         # Skills are tracked in the breakdown
-        breakdown = identity_score.breakdown or {}
-        skills_score = breakdown.get("skills_defined", 0)
-        
-        # Each skill is worth 2 points (max 10 points for 5 skills)
-        # So skill_count = skills_score / 2
-        skill_count = int(skills_score / 2)
+        breakdown = identity_score.breakdown if identity_score else None
+        if not breakdown:
+            return 0
         
-        return skill_count
+        # Each skill is worth 2 points (max 10 points for 5 skills), so
+        # skill_count = skills_score // 2 (scores are never negative)
+        return int(breakdown.get("skills_defined", 0)) // 2
     
     # Backward compatibility alias (v1 API)
     get_skill_count = get_a2a_skill_count
@@ -270,7 +433,8 @@ class SkillsBoostCalculator:
     def get_combined_skill_points(
         self, 
         category_scores: Dict[Category, CategoryScore],
-        moltbook_username: Optional[str] = None
+        moltbook_username: Optional[str] = None,
+        include_moltbook: bool = True
     ) -> Dict[str, Any]:
         """
         Calculate combined skill points from A2A card + Moltbook activity.
@@ -284,6 +448,8 @@ class SkillsBoostCalculator:
         Args:
             category_scores: Dict of category scores
             moltbook_username: Optional Moltbook username (overrides constructor)
+            include_moltbook: False skips the Moltbook lookup, scoring as
+                if no profile were available
             
         Returns:
             Dict with combined_points, a2a_points, moltbook_points, breakdown
@@ -294,7 +460,10 @@ class SkillsBoostCalculator:
         
         # Get Moltbook activity points
         mb_username = moltbook_username or self._moltbook_username
-        mb_data = self._calculate_moltbook_skill_points(mb_username)
+        if include_moltbook:
+            mb_data = self._calculate_moltbook_skill_points(mb_username)
+        else:
+            mb_data = {"points": 0, "breakdown": {}, "raw": None}
         mb_points = min(mb_data["points"], 10)  # Cap at 10
         
         # Combined scoring: 50% A2A + 50% Moltbook
@@ -322,6 +491,13 @@ class SkillsBoostCalculator:
         Returns:
             Multiplier to apply (1.0 = no boost, 1.12 = max boost)
         """
+        if type(points) is int and points >= 0:
+            table = self._multiplier_table
+            return table[points] if points < len(table) else table[-1]
+        return self._scan_tiers(points)
+    
+    def _scan_tiers(self, points: float) -> float:
+        """Find the boost tier containing points by scanning BOOST_TIERS."""
         for min_pts, max_pts, multiplier in self.BOOST_TIERS:
             if min_pts <= points <= max_pts:
                 return multiplier
@@ -354,8 +530,11 @@ class SkillsBoostCalculator:
                 - moltbook_points: Moltbook activity points
                 - has_moltbook_data: Whether Moltbook data was available
         """
-        # Calculate combined skill points
-        skill_data = self.get_combined_skill_points(category_scores, moltbook_username)
+        # Calculate combined skill points. A zero composite stays zero under
+        # any multiplier, so it isn't worth a Moltbook request
+        skill_data = self.get_combined_skill_points(
+            category_scores, moltbook_username, include_moltbook=composite_score != 0
+        )
         combined_points = skill_data["combined_points"]
         
         multiplier = self.get_multiplier(int(combined_points))
@@ -2,12 +2,15 @@
 Tests for the refactored scoring system.
 
 Run with: python -m pytest tests/ -v
+Or in parallel: python -m pytest tests/ -n auto (needs pytest-xdist)
 Or: python -m unittest tests.test_scoring -v
+
+Set SCORING_FAST_TESTS=1 to skip the end-to-end integration tests.
 """
 
+import os
+import sys
 import unittest
-import json
-from datetime import datetime
 
 # Import the scoring module
 from scoring.constants import (
@@ -26,6 +29,31 @@ from scoring.calculators import (
 from scoring.score_calculator import ScoreCalculator
 
 
+# A complete GitHub profile that scores 95 for CODE
+GITHUB_FULL = {
+    "public_repos": 5,      # 25 points
+    "recent_commits": 10,   # 20 points
+    "stars": 75,            # 15 points
+    "bio_has_agent_keywords": True,  # 10 points
+    "prs_merged": 5,        # 25 points
+}
+
+# PlatformData built by fixture(), by scenario name
+_FIXTURES = {}
+
+
+def fixture(name, **kwargs):
+    """
+    Get the PlatformData for a scenario, building it on first use.
+    
+    Calculators only read PlatformData, so tests share one instance per
+    scenario instead of building a new one in every test.
+    """
+    if name not in _FIXTURES:
+        _FIXTURES[name] = PlatformData(**kwargs)
+    return _FIXTURES[name]
+
+
 class TestWeightConfig(unittest.TestCase):
     """Test WeightConfig dataclass."""
     
@@ -53,26 +81,21 @@ class TestWeightConfig(unittest.TestCase):
 class TestTier(unittest.TestCase):
     """Test Tier enum and tier calculation."""
     
-    def test_tier_from_score_pioneer(self):
-        """Test Pioneer tier (90+)."""
-        self.assertEqual(Tier.from_score(95), Tier.PIONEER)
-        self.assertEqual(Tier.from_score(90), Tier.PIONEER)
-    
-    def test_tier_from_score_autonomous(self):
-        """Test Autonomous tier (75-89)."""
-        self.assertEqual(Tier.from_score(75), Tier.AUTONOMOUS)
-        self.assertEqual(Tier.from_score(80), Tier.AUTONOMOUS)
-        self.assertEqual(Tier.from_score(89), Tier.AUTONOMOUS)
-    
-    def test_tier_from_score_signal_zero(self):
-        """Test Signal Zero tier (0)."""
-        self.assertEqual(Tier.from_score(0), Tier.SIGNAL_ZERO)
-    
-    def test_tier_labels(self):
-        """Test tier labels."""
-        self.assertEqual(Tier.PIONEER.label, "Pioneer")
-        self.assertEqual(Tier.AUTONOMOUS.label, "Autonomous")
-        self.assertEqual(Tier.SIGNAL_ZERO.label, "Signal Zero")
+    def test_tiers(self):
+        """Test tier and label for representative scores."""
+        cases = [
+            (95, Tier.PIONEER, "Pioneer"),
+            (90, Tier.PIONEER, "Pioneer"),
+            (89, Tier.AUTONOMOUS, "Autonomous"),
+            (80, Tier.AUTONOMOUS, "Autonomous"),
+            (75, Tier.AUTONOMOUS, "Autonomous"),
+            (0, Tier.SIGNAL_ZERO, "Signal Zero"),
+        ]
+        for score, expected_tier, expected_label in cases:
+            with self.subTest(score=score):
+                tier = Tier.from_score(score)
+                self.assertEqual(tier, expected_tier)
+                self.assertEqual(tier.label, expected_label)
 
 
 class TestCategoryScore(unittest.TestCase):
@@ -130,11 +153,42 @@ class TestPlatformData(unittest.TestCase):
         self.assertEqual(data.get("missing", 0), 0)
 
 
+# A GitHub profile with every CODE signal at zero
+GITHUB_ZERO = {
+    "public_repos": 0,
+    "recent_commits": 0,
+    "stars": 0,
+    "bio_has_agent_keywords": False,
+    "prs_merged": 0,
+}
+
+# CodeScoreCalculator scenarios: (name, GitHub data, expected breakdown
+# entries, expected score)
+CODE_CASES = [
+    ("public_repos", GITHUB_ZERO | {"public_repos": 5},  # 5 repos = 25 points (max)
+     {"public_repos": 25.0}, 25),
+    ("repos_cap", GITHUB_ZERO | {"public_repos": 10},  # 50 raw points, capped at 25
+     {"public_repos": 25.0}, 25),
+    ("stars", GITHUB_ZERO | {"stars": 100},  # 1 point per 5 stars, capped at 15
+     {"stars": 15.0}, 15),
+    ("bio_signals", GITHUB_ZERO | {"bio_has_agent_keywords": True},
+     {"bio_signals": 10.0}, 10),
+    ("full_profile", GITHUB_FULL, {
+        "public_repos": 25.0,
+        "recent_commits": 20.0,
+        "stars": 15.0,
+        "bio_signals": 10.0,
+        "prs_merged": 25.0,
+    }, 95),  # 25 + 20 + 15 + 10 + 25
+]
+
+
 class TestCodeScoreCalculator(unittest.TestCase):
     """Test CodeScoreCalculator."""
     
-    def setUp(self):
-        self.calculator = CodeScoreCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calculator = CodeScoreCalculator()
     
     def test_empty_data(self):
         """Test with empty/unavailable data."""
@@ -144,87 +198,25 @@ class TestCodeScoreCalculator(unittest.TestCase):
         self.assertEqual(result.category, Category.CODE)
         self.assertEqual(result.score, 0)
     
-    def test_public_repos_scoring(self):
-        """Test public repos score calculation."""
-        # 5 repos = 25 points (max)
-        data = PlatformData("github", status="ok", data={
-            "public_repos": 5,
-            "recent_commits": 0,
-            "stars": 0,
-            "bio_has_agent_keywords": False,
-            "prs_merged": 0,
-        })
-        result = self.calculator.calculate(data)
-        
-        self.assertEqual(result.breakdown["public_repos"], 25.0)
-        self.assertEqual(result.score, 25)
-    
-    def test_repos_cap(self):
-        """Test that repo score caps at max."""
-        # 10 repos = 50 raw points, but capped at 25
-        data = PlatformData("github", status="ok", data={
-            "public_repos": 10,
-            "recent_commits": 0,
-            "stars": 0,
-            "bio_has_agent_keywords": False,
-            "prs_merged": 0,
-        })
-        result = self.calculator.calculate(data)
-        
-        self.assertEqual(result.breakdown["public_repos"], 25.0)  # Capped
-    
-    def test_stars_scoring(self):
-        """Test stars score calculation."""
-        # 100 stars = 20 points (1 per 5 stars, max 15)
-        data = PlatformData("github", status="ok", data={
-            "public_repos": 0,
-            "recent_commits": 0,
-            "stars": 100,
-            "bio_has_agent_keywords": False,
-            "prs_merged": 0,
-        })
-        result = self.calculator.calculate(data)
-        
-        self.assertEqual(result.breakdown["stars"], 15.0)  # Capped at 15
-    
-    def test_bio_signals(self):
-        """Test bio signals score."""
-        data = PlatformData("github", status="ok", data={
-            "public_repos": 0,
-            "recent_commits": 0,
-            "stars": 0,
-            "bio_has_agent_keywords": True,
-            "prs_merged": 0,
-        })
-        result = self.calculator.calculate(data)
-        
-        self.assertEqual(result.breakdown["bio_signals"], 10.0)
-    
-    def test_full_profile(self):
-        """Test with a complete profile."""
-        data = PlatformData("github", status="ok", data={
-            "public_repos": 5,      # 25 points
-            "recent_commits": 10,   # 20 points (capped)
-            "stars": 75,            # 15 points
-            "bio_has_agent_keywords": True,  # 10 points
-            "prs_merged": 5,        # 25 points
-        })
-        result = self.calculator.calculate(data)
-        
-        # Total = 25 + 20 + 15 + 10 + 25 = 95
-        self.assertEqual(result.breakdown["public_repos"], 25.0)
-        self.assertEqual(result.breakdown["recent_commits"], 20.0)
-        self.assertEqual(result.breakdown["stars"], 15.0)
-        self.assertEqual(result.breakdown["bio_signals"], 10.0)
-        self.assertEqual(result.breakdown["prs_merged"], 25.0)
-        self.assertEqual(result.score, 95)
+    def test_code_scoring_cases(self):
+        """Test dimension scores and totals for each CODE_CASES scenario."""
+        for name, data, expected_breakdown, expected_score in CODE_CASES:
+            with self.subTest(name=name):
+                result = self.calculator.calculate(PlatformData("github", status="ok", data=data))
+                
+                self.assertEqual(
+                    {key: result.breakdown.get(key) for key in expected_breakdown},
+                    expected_breakdown,
+                )
+                self.assertEqual(result.score, expected_score)
 
 
 class TestIdentityScoreCalculator(unittest.TestCase):
     """Test IdentityScoreCalculator."""
     
-    def setUp(self):
-        self.calculator = IdentityScoreCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calculator = IdentityScoreCalculator()
     
     def test_full_identity(self):
         """Test with complete identity."""
@@ -261,17 +253,21 @@ class TestIdentityScoreCalculator(unittest.TestCase):
         result = self.calculator.calculate(data)
         
         # 30 + 10 + 0 + 0 + 20 + 0 + 0 = 60
-        self.assertEqual(result.breakdown["has_agent_card"], 30.0)
-        self.assertEqual(result.breakdown["card_valid"], 10.0)
-        self.assertEqual(result.breakdown["required_fields"], 0.0)
+        expected = {
+            "has_agent_card": 30.0,
+            "card_valid": 10.0,
+            "required_fields": 0.0,
+        }
+        self.assertEqual({key: result.breakdown.get(key) for key in expected}, expected)
         self.assertEqual(result.score, 60)
 
 
 class TestEconomicScoreCalculator(unittest.TestCase):
     """Test EconomicScoreCalculator."""
     
-    def setUp(self):
-        self.calculator = EconomicScoreCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calculator = EconomicScoreCalculator()
     
     def test_unavailable(self):
         """Test with unavailable platform."""
@@ -296,17 +292,21 @@ class TestEconomicScoreCalculator(unittest.TestCase):
         result = self.calculator.calculate(data)
         
         # 20 + 20 + 40 + 5 + 15 = 100
-        self.assertEqual(result.breakdown["has_profile"], 20.0)
-        self.assertEqual(result.breakdown["services_listed"], 20.0)
-        self.assertEqual(result.breakdown["jobs_completed"], 40.0)
+        expected = {
+            "has_profile": 20.0,
+            "services_listed": 20.0,
+            "jobs_completed": 40.0,
+        }
+        self.assertEqual({key: result.breakdown.get(key) for key in expected}, expected)
         self.assertEqual(result.score, 100)
 
 
 class TestScoreCalculator(unittest.TestCase):
     """Test the main ScoreCalculator orchestrator."""
     
-    def setUp(self):
-        self.calculator = ScoreCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calculator = ScoreCalculator()
     
     def test_empty_platforms(self):
         """Test with no platforms."""
@@ -326,13 +326,7 @@ class TestScoreCalculator(unittest.TestCase):
             handle="test",
             name="Test Agent",
             platform_data={
-                "github": PlatformData("github", status="ok", data={
-                    "public_repos": 5,
-                    "recent_commits": 10,
-                    "stars": 75,
-                    "bio_has_agent_keywords": True,
-                    "prs_merged": 5,
-                })
+                "github": fixture("github_full", platform="github", status="ok", data=GITHUB_FULL)
             }
         )
         
@@ -342,40 +336,6 @@ class TestScoreCalculator(unittest.TestCase):
         self.assertEqual(result.category_scores[Category.CODE].score, 95)
         self.assertIn("composite_breakdown", result.metadata)
     
-    def test_full_profile(self):
-        """Test with complete profile."""
-        result = self.calculator.calculate(
-            handle="bobrenze",
-            name="Bob",
-            platform_data={
-                "github": PlatformData("github", status="ok", data={
-                    "public_repos": 5,
-                    "recent_commits": 10,
-                    "stars": 75,
-                    "bio_has_agent_keywords": True,
-                    "prs_merged": 5,
-                }),
-                "a2a": PlatformData("a2a", status="ok", data={
-                    "has_agent_card": True,
-                    "card_valid": True,
-                    "card": {
-                        "name": "Bob",
-                        "description": "AI Agent",
-                        "capabilities": {"tools": ["test"]}
-                    },
-                    "has_agents_json": True,
-                    "has_llms_txt": True,
-                    "has_openclaw_install": True,
-                }),
-            }
-        )
-        
-        self.assertEqual(result.handle, "bobrenze")
-        self.assertIn(Category.CODE, result.category_scores)
-        self.assertIn(Category.IDENTITY, result.category_scores)
-        self.assertGreater(result.composite_score, 0)
-        self.assertIn("composite_breakdown", result.metadata)
-    
     def test_calculate_from_profile_legacy(self):
         """Test legacy profile format."""
         profile_data = {
@@ -438,9 +398,8 @@ class TestScoreResult(unittest.TestCase):
         )
         
         d = result.to_dict()
-        self.assertEqual(d["handle"], "test")
-        self.assertEqual(d["composite_score"], 50)
-        self.assertEqual(d["tier"], "Active")
+        expected = {"handle": "test", "composite_score": 50, "tier": "Active"}
+        self.assertEqual({key: d.get(key) for key in expected}, expected)
         self.assertIn("category_scores", d)
 
 
@@ -461,14 +420,14 @@ class TestCustomWeights(unittest.TestCase):
         self.assertEqual(calculator.weights[Category.IDENTITY], 3.0)
 
 
+@unittest.skipIf(os.environ.get("SCORING_FAST_TESTS") == "1", "integration skipped in fast mode")
 class TestIntegration(unittest.TestCase):
     """Integration tests using realistic data."""
     
-    def test_bobrenze_simulation(self):
-        """Simulate scoring for a realistic agent profile."""
-        calculator = ScoreCalculator()
-        
-        platform_data = {
+    @classmethod
+    def setUpClass(cls):
+        cls.calculator = ScoreCalculator()
+        cls.bobrenze_data = {
             "github": PlatformData("github", status="ok", data={
                 "public_repos": 3,
                 "recent_commits": 15,
@@ -502,11 +461,13 @@ class TestIntegration(unittest.TestCase):
                 },
             }),
         }
-        
-        result = calculator.calculate(
+    
+    def test_bobrenze_simulation(self):
+        """Simulate scoring for a realistic agent profile."""
+        result = self.calculator.calculate(
             handle="bobrenze",
             name="Bob Renze",
-            platform_data=platform_data
+            platform_data=self.bobrenze_data
         )
         
         # Verify structure
@@ -525,31 +486,33 @@ class TestIntegration(unittest.TestCase):
         # IDENTITY should be 100 (full marks)
         identity_score = result.category_scores[Category.IDENTITY].score
         self.assertEqual(identity_score, 100)
-        
-        # Print breakdown for debugging
-        print(f"\nComposite Score: {result.composite_score}")
-        print(f"Tier: {result.tier_label}")
-        for cat, score in result.category_scores.items():
-            print(f"  {cat.value}: {score.score}/100")
 
 
 def run_tests():
-    """Run all tests."""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestWeightConfig))
-    suite.addTests(loader.loadTestsFromTestCase(TestTier))
-    suite.addTests(loader.loadTestsFromTestCase(TestCategoryScore))
-    suite.addTests(loader.loadTestsFromTestCase(TestPlatformData))
-    suite.addTests(loader.loadTestsFromTestCase(TestCodeScoreCalculator))
-    suite.addTests(loader.loadTestsFromTestCase(TestIdentityScoreCalculator))
-    suite.addTests(loader.loadTestsFromTestCase(TestEconomicScoreCalculator))
-    suite.addTests(loader.loadTestsFromTestCase(TestScoreCalculator))
-    suite.addTests(loader.loadTestsFromTestCase(TestScoreResult))
-    suite.addTests(loader.loadTestsFromTestCase(TestCustomWeights))
-    suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
+    """
+    Run all tests.
+    
+    Uses pytest when it is installed, spread over every core with
+    pytest-xdist when that is installed too; the tests share no mutable
+    state, so they can run in any order. Falls back to unittest.
+    """
+    try:
+        import pytest
+    except ImportError:
+        pytest = None
+    
+    if pytest is not None:
+        args = [__file__, "-v"]
+        try:
+            import xdist  # noqa: F401
+            
+            args += ["-n", "auto"]
+        except ImportError:
+            pass
+        return pytest.main(args) == 0
+    
+    # Every TestCase class in this module, without a list to keep in sync
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -6,6 +6,7 @@ This eliminates duplication across test_skills_boost.py, test_skills_boost_stand
 and test_integration_skills_boost.py.
 """
 
+import functools
 import unittest
 import sys
 import os
@@ -39,6 +40,55 @@ except ImportError:
         PlatformData = models.PlatformData
 
 
+# Parts of make_platform_data_with_skills() that don't depend on the skill
+# count, built once. Scoring only reads PlatformData, so every call shares
+# them; treat them as read-only.
+_GITHUB_PLATFORM_DATA = PlatformData(
+    platform="github",
+    status="ok",
+    data={
+        "public_repos": 5,
+        "recent_commits": 10,
+        "stars": 50,
+        "bio_has_agent_keywords": True,
+        "prs_merged": 2,
+    }
+)
+_TOKU_PLATFORM_DATA = PlatformData(
+    platform="toku",
+    status="ok",
+    data={
+        "has_profile": True,
+        "services_count": 2,
+        "jobs_completed": 0,
+    }
+)
+_A2A_CARD_TEMPLATE = {
+    "schemaVersion": "1.0",
+    "humanReadableId": "test/agent",
+    "agentVersion": "1.0",
+    "name": "Test Agent",
+    "description": "Test agent for skills boost",
+    "url": "https://example.com",
+    "provider": {"name": "Test"},
+    "capabilities": {"a2aVersion": "1.0"},
+    "authSchemes": [{"scheme": "none", "description": "public"}],
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _identity_score(skill_count: int) -> CategoryScore:
+    """IDENTITY score for skill_count skills, shared by every test (read-only)."""
+    # Skills are scored at 2 points each, capped at 10 points
+    skills_points = min(skill_count * 2, 10)
+    
+    return CategoryScore(
+        category=Category.IDENTITY,
+        score=50 + skills_points,  # Base score + skills points
+        breakdown={"skills_defined": skills_points}
+    )
+
+
 class BaseSkillsBoostTest(unittest.TestCase):
     """
     Base test class for skills boost functionality.
@@ -50,6 +100,24 @@ class BaseSkillsBoostTest(unittest.TestCase):
     - Testing multiplier tiers
     """
     
+    # (skill count, expected multiplier) for every boost tier and its edges
+    MULTIPLIER_TIER_CASES = (
+        (0, 1.00),   # No skills
+        (1, 1.03),   # 1-2 skills
+        (2, 1.03),
+        (3, 1.05),   # 3-4 skills
+        (4, 1.05),
+        (5, 1.08),   # 5-7 skills
+        (6, 1.08),
+        (7, 1.08),
+        (8, 1.10),   # 8-10 skills
+        (9, 1.10),
+        (10, 1.10),
+        (11, 1.12),  # 11+ skills (max)
+        (15, 1.12),
+        (20, 1.12),
+    )
+    
     def setUp(self):
         """Set up test fixtures."""
         self.calculator = SkillsBoostCalculator()
@@ -66,16 +134,8 @@ class BaseSkillsBoostTest(unittest.TestCase):
         Returns:
             Dict mapping Category.IDENTITY to CategoryScore
         """
-        # Skills are scored at 2 points each, capped at 10 points
-        skills_points = min(skill_count * 2, 10)
-        
-        return {
-            Category.IDENTITY: CategoryScore(
-                category=Category.IDENTITY,
-                score=50 + skills_points,  # Base score + skills points
-                breakdown={"skills_defined": skills_points}
-            )
-        }
+        # A fresh dict, so callers may add categories; the score is cached
+        return {Category.IDENTITY: _identity_score(skill_count)}
     
     def make_platform_data_with_skills(self, skill_count: int) -> dict:
         """
@@ -93,46 +153,17 @@ class BaseSkillsBoostTest(unittest.TestCase):
         ]
         
         return {
-            "github": PlatformData(
-                platform="github",
-                status="ok",
-                data={
-                    "public_repos": 5,
-                    "recent_commits": 10,
-                    "stars": 50,
-                    "bio_has_agent_keywords": True,
-                    "prs_merged": 2,
-                }
-            ),
+            "github": _GITHUB_PLATFORM_DATA,
             "a2a": PlatformData(
                 platform="a2a",
                 status="ok",
                 data={
-                    "card": {
-                        "schemaVersion": "1.0",
-                        "humanReadableId": "test/agent",
-                        "agentVersion": "1.0",
-                        "name": "Test Agent",
-                        "description": "Test agent for skills boost",
-                        "url": "https://example.com",
-                        "provider": {"name": "Test"},
-                        "capabilities": {"a2aVersion": "1.0"},
-                        "authSchemes": [{"scheme": "none", "description": "public"}],
-                        "skills": skills,
-                    },
+                    "card": {**_A2A_CARD_TEMPLATE, "skills": skills},
                     "has_agents_json": True,
                     "has_llms_txt": True,
                 }
             ),
-            "toku": PlatformData(
-                platform="toku",
-                status="ok",
-                data={
-                    "has_profile": True,
-                    "services_count": 2,
-                    "jobs_completed": 0,
-                }
-            ),
+            "toku": _TOKU_PLATFORM_DATA,
         }
     
     # ========== Assertion Helpers ==========
@@ -187,30 +218,14 @@ class BaseSkillsBoostTest(unittest.TestCase):
         Test all multiplier tiers.
         Should be called by subclasses in their test methods.
         """
-        test_cases = [
-            (0, 1.00),   # No skills
-            (1, 1.03),   # 1-2 skills
-            (2, 1.03),
-            (3, 1.05),   # 3-4 skills
-            (4, 1.05),
-            (5, 1.08),   # 5-7 skills
-            (6, 1.08),
-            (7, 1.08),
-            (8, 1.10),   # 8-10 skills
-            (9, 1.10),
-            (10, 1.10),
-            (11, 1.12),  # 11+ skills (max)
-            (15, 1.12),
-            (20, 1.12),
-        ]
-        
-        for skill_count, expected_multiplier in test_cases:
-            multiplier = self.calculator.get_multiplier(skill_count)
-            self.assertEqual(
-                multiplier,
-                expected_multiplier,
-                f"Skills {skill_count}: expected {expected_multiplier}x, got {multiplier}x"
-            )
+        for skill_count, expected_multiplier in self.MULTIPLIER_TIER_CASES:
+            with self.subTest(skill_count=skill_count):
+                multiplier = self.calculator.get_multiplier(skill_count)
+                self.assertEqual(
+                    multiplier,
+                    expected_multiplier,
+                    f"Skills {skill_count}: expected {expected_multiplier}x, got {multiplier}x"
+                )
     
     def run_score_capping_test(self):
         """
@@ -6,8 +6,13 @@ Verifies that agents with defined skills receive appropriate multipliers
 on their composite scores.
 """
 
+import functools
 import sys
 import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
 
 # Add scoring directory to path
 scoring_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -15,6 +20,14 @@ sys.path.insert(0, scoring_dir)
 
 from base_skills_boost_test import BaseSkillsBoostTest
 
+# The pooled-client tests drive httpx through a mock transport
+try:
+    import httpx
+    
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 
 class TestSkillsBoost(BaseSkillsBoostTest):
     """Test skills boost calculation using base class."""
@@ -45,6 +58,15 @@ class TestSkillsBoost(BaseSkillsBoostTest):
         multiplier = self.calculator.get_multiplier(11)
         self.assertEqual(multiplier, 1.12)
     
+    def test_multiplier_table_matches_tiers(self):
+        """Table lookup agrees with scanning BOOST_TIERS, including past the top tier."""
+        for points in list(range(0, 1200)) + [-1, 2.5]:
+            self.assertEqual(
+                self.calculator.get_multiplier(points),
+                self.calculator._scan_tiers(points),
+                points
+            )
+    
     def test_score_capping(self):
         """Test that boosted scores are capped at 100."""
         self.run_score_capping_test()
@@ -85,14 +107,186 @@ class TestSkillsBoost(BaseSkillsBoostTest):
     def test_missing_identity_category(self):
         """Test handling when IDENTITY category is missing."""
         self.run_missing_identity_test()
+    
+    def test_moltbook_threshold_points(self):
+        """Moltbook metrics score by the thresholds they reach."""
+        self.calculator._cached_moltbook_data = {
+            "karma": 101,
+            "follower_count": 10,
+            "posts_count": 0,
+            "comments_count": 101,
+            "is_verified": True,
+        }
+        result = self.calculator._calculate_moltbook_skill_points("agent")
+        
+        self.assertEqual(
+            {metric: entry["points"] for metric, entry in result["breakdown"].items()},
+            {"karma": 1.0, "followers": 0.25, "posts": 0, "comments": 1.0, "verified": 0.5}
+        )
+        self.assertEqual(result["points"], 2.75)
+        self.assertEqual(result["raw"]["follower_count"], 10)
+    
+    def test_moltbook_profile_disk_cache(self):
+        """A fetched profile is served from disk until its TTL expires."""
+        profile = {"karma": 42, "follower_count": 3}
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = type(self.calculator)(moltbook_cache_dir=cache_dir)
+            with mock.patch.object(first, "_request_moltbook_profile", return_value=profile) as request:
+                self.assertEqual(first._fetch_moltbook_profile("agent/x"), profile)
+                self.assertEqual(request.call_count, 1)
+            
+            second = type(self.calculator)(moltbook_cache_dir=cache_dir)
+            with mock.patch.object(second, "_request_moltbook_profile", return_value=None) as request:
+                self.assertEqual(second._fetch_moltbook_profile("agent/x"), profile)
+                self.assertEqual(request.call_count, 0)
+            
+            expired = type(self.calculator)(moltbook_cache_dir=cache_dir, moltbook_cache_ttl=0)
+            with mock.patch.object(expired, "_request_moltbook_profile", return_value=None) as request:
+                self.assertIsNone(expired._fetch_moltbook_profile("agent/x"))
+                self.assertEqual(request.call_count, 1)
+    
+    def test_moltbook_disk_cache_opt_in(self):
+        """Without a cache directory nothing is written; the env var supplies one."""
+        cls = type(self.calculator)
+        profile = {"karma": 42}
+        with tempfile.TemporaryDirectory() as home, \
+                mock.patch.dict(os.environ, {"HOME": home}):
+            os.environ.pop(cls.MOLTBOOK_CACHE_DIR_ENV, None)
+            uncached = cls()
+            with mock.patch.object(uncached, "_request_moltbook_profile", return_value=profile):
+                uncached._fetch_moltbook_profile("agent")
+            self.assertIsNone(uncached.moltbook_cache_dir)
+            self.assertEqual(os.listdir(home), [])
+            
+            cache_dir = os.path.join(home, "cache")
+            os.environ[cls.MOLTBOOK_CACHE_DIR_ENV] = cache_dir
+            cached = cls()
+            with mock.patch.object(cached, "_request_moltbook_profile", return_value=profile):
+                cached._fetch_moltbook_profile("agent")
+            self.assertEqual(os.listdir(cache_dir), ["agent.json"])
+    
+    def test_zero_composite_skips_moltbook(self):
+        """A zero composite is not boosted and triggers no Moltbook lookup."""
+        calculator = type(self.calculator)(moltbook_username="agent")
+        with mock.patch.object(calculator, "_fetch_moltbook_profile") as fetch:
+            boost_info = calculator.calculate_boost(0, self.make_category_scores(3))
+        
+        fetch.assert_not_called()
+        self.assertEqual(boost_info["boosted_score"], 0)
+        self.assertEqual(boost_info["a2a_skill_count"], 3)
+        self.assertFalse(boost_info["has_moltbook_data"])
+    
+    def test_moltbook_key_read_once(self):
+        """Credentials files are read once; an explicit key skips them."""
+        cls = type(self.calculator)
+        unset = sys.modules[cls.__module__]._UNSET
+        with mock.patch.object(cls, "_KEY_CACHE", unset), \
+                mock.patch.object(cls, "_read_moltbook_key", return_value="file-key") as read:
+            self.assertEqual(cls()._load_moltbook_key(), "file-key")
+            self.assertEqual(cls()._load_moltbook_key(), "file-key")
+            self.assertEqual(cls(moltbook_api_key="explicit")._load_moltbook_key(), "explicit")
+            self.assertEqual(read.call_count, 1)
+    
+    def test_moltbook_key_miss_not_cached(self):
+        """A lookup with no credentials file doesn't stop a later one finding the key."""
+        cls = type(self.calculator)
+        unset = sys.modules[cls.__module__]._UNSET
+        with mock.patch.object(cls, "_KEY_CACHE", unset), \
+                mock.patch.object(cls, "_read_moltbook_key", side_effect=[None, "late-key"]):
+            self.assertIsNone(cls()._load_moltbook_key())
+            self.assertIs(cls._KEY_CACHE, unset)
+            self.assertEqual(cls()._load_moltbook_key(), "late-key")
+    
+    def test_prefetch_moltbook_profiles(self):
+        """Prefetched profiles are fetched once each and used for scoring."""
+        profiles = {"alpha": {"karma": 600}, "beta": None}
+        calculator = type(self.calculator)()
+        with mock.patch.object(calculator, "_fetch_moltbook_profile",
+                               side_effect=profiles.get) as fetch:
+            calculator.prefetch(["alpha", "beta", "alpha", ""])
+            calculator.prefetch(["alpha"])
+            
+            self.assertEqual(sorted(call.args[0] for call in fetch.call_args_list), ["alpha", "beta"])
+            self.assertEqual(calculator._calculate_moltbook_skill_points("alpha")["points"], 1.5)
+            self.assertEqual(
+                calculator._calculate_moltbook_skill_points("beta").get("error"),
+                "profile_unavailable"
+            )
+            # The failed fetch was not kept, so scoring retried it
+            self.assertEqual(fetch.call_count, 3)
+        self.assertEqual(type(self.calculator)()._profile_cache, {})
+    
+    def test_prefetch_cache_bounded(self):
+        """Prefetch keeps at most PROFILE_CACHE_SIZE profiles, dropping the least recently used."""
+        calculator = type(self.calculator)()
+        calculator.PROFILE_CACHE_SIZE = 2
+        with mock.patch.object(calculator, "_fetch_moltbook_profile",
+                               side_effect=lambda name: {"karma": len(name)}):
+            calculator.prefetch(["a", "bb"])
+            calculator._calculate_moltbook_skill_points("a")
+            calculator.prefetch(["ccc"])
+        
+        self.assertEqual(list(calculator._profile_cache), ["a", "ccc"])
+
+
+@unittest.skipUnless(HTTPX_AVAILABLE, "httpx not installed")
+class TestMoltbookHttpx(BaseSkillsBoostTest):
+    """Test Moltbook requests through the pooled httpx client."""
+    
+    def setUp(self):
+        super().setUp()
+        module = sys.modules[type(self.calculator).__module__]
+        transport = httpx.MockTransport(self.handle_request)
+        # A fresh pooled client, built by _http_client() on the mock transport
+        patches = [
+            mock.patch.object(module, "_HTTP_CLIENT", None),
+            mock.patch.object(httpx, "Client", functools.partial(httpx.Client, transport=transport)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.client = type(self.calculator)(moltbook_api_key="key", moltbook_cache_ttl=0)
+    
+    @staticmethod
+    def handle_request(request):
+        """Serve profiles for alpha, redirect moved to alpha, fail the rest."""
+        name = request.url.params["name"]
+        if name == "alpha":
+            assert request.headers["Authorization"] == "Bearer key"
+            return httpx.Response(200, json={"success": True, "agent": {"karma": 600}})
+        if name == "moved":
+            return httpx.Response(301, headers={"Location": "/api/v1/agents/profile?name=alpha"})
+        return httpx.Response(500, json={"success": False})
+    
+    def test_profile_ok(self):
+        """A 200 response yields the agent profile."""
+        self.assertEqual(self.client._request_moltbook_profile("alpha"), {"karma": 600})
+    
+    def test_profile_redirect_followed(self):
+        """Redirects are followed to the profile."""
+        self.assertEqual(self.client._request_moltbook_profile("moved"), {"karma": 600})
+    
+    def test_profile_error(self):
+        """An error status yields no profile."""
+        self.assertIsNone(self.client._request_moltbook_profile("missing"))
+    
+    def test_import_leaves_httpx_unloaded(self):
+        """httpx is only imported once a request needs the pooled client."""
+        code = "import sys, scoring.skills_boost; print('httpx' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(scoring_dir),
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
 
 
 def run_all_tests():
     """Run all skills boost tests."""
     print("\n🧪 Running Skills Boost Tests...\n")
     
-    import unittest
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestSkillsBoost)
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(TestSkillsBoost),
+        loader.loadTestsFromTestCase(TestMoltbookHttpx),
+    ])
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
     